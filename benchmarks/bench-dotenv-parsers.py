@@ -0,0 +1,40 @@
+import os
+import tempfile
+import timeit
+
+from simputils.config.components.handlers import DotEnvFileHandler
+
+LINES = 10000
+NUMBER = 10
+
+
+_LINE_TEMPLATES = (
+	"# Comment {i}\n",
+	"PARAM_{i}=value {i}\n",
+	"export PARAM_{i}='single quoted {i}' # comment\n",
+	"PARAM_{i}=\"double quoted\\n{i}\"\n",
+	"PARAM_{i}=${{PARAM_{prev}}}/suffix\n",
+)
+
+
+def _generate(path: str):
+	with open(path, "w", encoding="utf-8") as fd:
+		for i in range(LINES):
+			fd.write(_LINE_TEMPLATES[i % len(_LINE_TEMPLATES)].format(i=i, prev=i - 3))
+
+
+if __name__ == "__main__":
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		file = os.path.join(tmp_dir, "bench.env")
+		_generate(file)
+
+		for interpolate in (True, False):
+			dotenv_handler = DotEnvFileHandler(interpolate=interpolate)
+			native_handler = DotEnvFileHandler(native=True, interpolate=interpolate)
+			assert dotenv_handler.parse_file(file).data == native_handler.parse_file(file).data
+
+			legacy = min(timeit.repeat(lambda: dotenv_handler.parse_file(file), number=NUMBER, repeat=3))
+			native = min(timeit.repeat(lambda: native_handler.parse_file(file), number=NUMBER, repeat=3))
+
+			print(f"interpolate={interpolate!s:<6} python-dotenv {legacy:.4f}s")
+			print(f"interpolate={interpolate!s:<6} native        {native:.4f}s (x{legacy / native:.1f} faster)")
@@ -0,0 +1,168 @@
+from time import perf_counter
+
+from simputils.config.components.simpletons import NotExisting
+from simputils.config.components.strategies import MergingStrategyRecursive
+from simputils.config.generic import BasicMergingStrategy
+
+WIDE_ITEMS = 500
+LAYERS = 200
+DEEP_DEPTH = 300
+REPEAT = 3
+
+
+class LegacyMergingStrategyRecursive(BasicMergingStrategy):
+	"""
+	Recursive merging as it was done before the iterative one
+	"""
+
+	_list_extend: bool = None
+
+	def __init__(self, list_extend: bool = False):
+		self._list_extend = list_extend
+
+	# noinspection PyUnusedLocal
+	@classmethod
+	def _none_check(cls, val_target, val_incoming):
+		res = val_incoming is None
+		return res
+
+	# noinspection PyUnusedLocal
+	@classmethod
+	def _not_existing_check(cls, val_target, val_incoming):
+		res = val_target is not None and isinstance(val_target, NotExisting)
+		return res
+
+	@classmethod
+	def _primitive_check(cls, val_target, val_incoming):
+		primitives = (int, float, bool, str)
+		res = val_target is not None and val_incoming is not None and \
+			(isinstance(val_target, primitives) or isinstance(val_incoming, primitives))
+		return res
+
+	@classmethod
+	def _incompatible_check(cls, val_target, val_incoming):
+		# NOTE  If the val_target class != val_incoming class and val_target is not derivative of val_incoming.
+		check = isinstance(val_target, object) and isinstance(val_incoming, object) and \
+			not isinstance(val_target, val_incoming.__class__)
+		if check:
+			return True
+
+		return False
+
+	# NOTE  Verbatim copy of the baseline implementation kept for comparison, so it's not refactored
+	def merge(self, key, val_target, val_incoming, none_considered_empty: bool = False):  # noqa: C901
+		resulting_val = val_incoming
+		if not isinstance(val_target, NotExisting) and none_considered_empty and val_incoming is None:
+			resulting_val = val_target
+		# NOTE  internally recursion happens
+		main_args = (val_target, val_incoming)
+		check = self._none_check(*main_args) or \
+			self._not_existing_check(*main_args) or \
+			self._primitive_check(*main_args) or \
+			self._incompatible_check(*main_args)
+
+		if check:
+			# NOTE  uses incoming value if not-existing key, primitives or incompatible formats
+			#       basically any inconsistency, then the whole value is used of val_incoming
+			return resulting_val
+
+		if isinstance(val_target, (list, tuple)) or isinstance(val_incoming, (list, tuple)):
+			if self._list_extend:
+				return val_target + val_incoming
+
+			return val_incoming
+
+		if isinstance(val_target, dict) and isinstance(val_incoming, dict):
+			return self._dictionaries_merge(*main_args)
+
+		check = (isinstance(val_target, object) and isinstance(val_incoming, object)) or \
+			(isinstance(val_target, dict) and isinstance(val_incoming, object)) or \
+			(isinstance(val_target, object) and isinstance(val_incoming, dict))
+		if check:
+			return self._objects_merge(*main_args)
+
+		# NOTE  overrides the target value with the incoming one
+		return resulting_val  # pragma: no cover
+
+	def _dictionaries_merge(self, val_target: dict, val_incoming: dict):
+		for key, val_in in val_incoming.items():
+			if key in val_target:
+				val_target[key] = self.merge(key, val_target[key], val_in)
+			else:
+				val_target[key] = val_in
+
+		return val_target
+
+	def _objects_merge(self, val_target: object, val_incoming: object):
+		for key, val_in in val_incoming.__dict__.items():
+			if key in val_target.__dict__:
+				sub_val = self.merge(key, val_target.__dict__[key], val_in)
+				if sub_val is None:
+					sub_val = val_target.__dict__[key]
+				val_target.__dict__[key] = sub_val
+
+		return val_target
+
+
+def _layer(i: int) -> dict:
+	# NOTE  Shape of "test8" of `tests/fixtures/fixture_recursive_strategy_list_merge.py`, repeated
+	return {
+		f"service_{n}": {
+			"sub_test_1": f"gg-wp-{i}",
+			"sub_test_2": -i,
+			"sub_test_4": {
+				"sub_sub_test_1": i,
+				"sub_sub_test_6": (n, i),
+			},
+			"sub_test_5": {
+				"sub_sub_test_7": {
+					"sub_sub_sub_test1": [n, i],
+				},
+			},
+		}
+		for n in range(WIDE_ITEMS)
+	}
+
+
+def _deep(i: int) -> dict:
+	res = root = {}
+	for depth in range(DEEP_DEPTH):
+		res["sub_test_5"] = {"sub_sub_test_1": i, "sub_sub_sub_test1": [depth]}
+		res = res["sub_test_5"]
+	return root
+
+
+def _run(strategy, build: callable) -> tuple[dict, float]:
+	layers = [build(i) for i in range(LAYERS)]
+	started = perf_counter()
+	target = layers[0]
+	for layer in layers[1:]:
+		target = strategy.merge("key", target, layer)
+	return target, perf_counter() - started
+
+
+def _compare(baseline: float, spent: float) -> str:
+	if spent <= baseline:
+		return f"x{baseline / spent:.1f} faster"
+	return f"x{spent / baseline:.1f} slower"
+
+
+if __name__ == "__main__":
+	legacy = LegacyMergingStrategyRecursive(list_extend=True)
+	current = MergingStrategyRecursive(list_extend=True)
+	copying = MergingStrategyRecursive(list_extend=True, copy_on_write=True)
+	for title, build in (("wide", _layer), ("deep", _deep)):
+		assert _run(legacy, build)[0] == _run(current, build)[0] == _run(copying, build)[0]
+
+		legacy_time = min(_run(legacy, build)[1] for _ in range(REPEAT))
+		current_time = min(_run(current, build)[1] for _ in range(REPEAT))
+		copying_time = min(_run(copying, build)[1] for _ in range(REPEAT))
+
+		print(f"{title:<6} {'legacy recursive':<18} {legacy_time:.4f}s")
+		print(f"{title:<6} {'iterative':<18} {current_time:.4f}s ({_compare(legacy_time, current_time)})")
+		print(f"{title:<6} {'copy-on-write':<18} {copying_time:.4f}s ({_compare(legacy_time, copying_time)})")
+
+	DEEP_DEPTH = 20000
+	LAYERS = 3
+	_run(current, _deep)
+	print(f"depth of {DEEP_DEPTH} merged without RecursionError")
@@ -0,0 +1,45 @@
+import inspect
+import timeit
+
+from simputils.config.enums import ConfigStoreType, ProvenanceModesEnum
+from simputils.config.models import ConfigStore
+
+STACK_DEPTH = 50
+NUMBER = 2000
+
+
+def _legacy_setitem(conf: ConfigStore, key, value):
+	# NOTE  Call-site capture as it was done before `ProvenanceModesEnum`
+	frame_info = inspect.getframeinfo(inspect.stack()[1][0])
+	conf.config_apply(
+		{key: value},
+		f"{frame_info.function}:{frame_info.lineno}",
+		frame_info.filename,
+		ConfigStoreType.SINGLE_VALUE
+	)
+
+
+def _deep(depth: int, func):
+	# NOTE  Emulates deep framework stacks
+	if depth:
+		return _deep(depth - 1, func)
+	return func()
+
+
+def _measure(func):
+	return min(timeit.repeat(lambda: _deep(STACK_DEPTH, func), number=NUMBER, repeat=3))
+
+
+if __name__ == "__main__":
+	conf = ConfigStore()
+	legacy = _measure(lambda: _legacy_setitem(conf, "key", "value"))
+	print(f"{'legacy inspect.stack()':<24} {legacy:.4f}s")
+
+	for mode in ProvenanceModesEnum:
+		conf = ConfigStore(provenance_mode=mode)
+
+		def _set():
+			conf["key"] = "value"
+
+		spent = _measure(_set)
+		print(f"{mode.value:<24} {spent:.4f}s (x{legacy / spent:.1f} faster)")
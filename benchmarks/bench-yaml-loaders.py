@@ -0,0 +1,49 @@
+import os
+import tempfile
+import timeit
+
+import yaml
+
+from simputils.config.components.handlers import YamlFileHandler
+
+ITEMS = 5000
+NUMBER = 3
+
+
+def _generate(path: str):
+	data = {
+		f"service_{i}": {
+			"enabled": i % 2 == 0,
+			"port": 8000 + i,
+			"ratio": i / 7,
+			"name": f"Service number {i}",
+			"tags": [f"tag-{i}", f"group-{i % 10}"],
+		}
+		for i in range(ITEMS)
+	}
+	with open(path, "w", encoding="utf-8") as fd:
+		yaml.safe_dump(data, fd)
+
+
+def _legacy_load(path: str):
+	# NOTE  Loading as it was done before `use_libyaml`
+	with open(path, "r") as fd:
+		return yaml.safe_load(fd)
+
+
+if __name__ == "__main__":
+	with tempfile.TemporaryDirectory() as tmp_dir:
+		file = os.path.join(tmp_dir, "bench.yml")
+		_generate(file)
+
+		pure_handler = YamlFileHandler(use_libyaml=False)
+		c_handler = YamlFileHandler()
+		assert _legacy_load(file) == pure_handler.parse_file(file).data == c_handler.parse_file(file).data
+
+		legacy = min(timeit.repeat(lambda: _legacy_load(file), number=NUMBER, repeat=3))
+		pure = min(timeit.repeat(lambda: pure_handler.parse_file(file), number=NUMBER, repeat=3))
+		accelerated = min(timeit.repeat(lambda: c_handler.parse_file(file), number=NUMBER, repeat=3))
+
+		print(f"{'legacy yaml.safe_load':<24} {legacy:.4f}s")
+		print(f"{'SafeLoader':<24} {pure:.4f}s (x{legacy / pure:.1f} faster)")
+		print(f"{'CSafeLoader':<24} {accelerated:.4f}s (x{legacy / accelerated:.1f} faster)")
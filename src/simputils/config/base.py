@@ -16,17 +16,31 @@ def simputils_pp(k: str, v: Any, replace_pattern=r"[^0-9a-zA-Z_]+", replaced_wit
 	"""
 	from simputils.config.components.preprocessors import SimputilsStandardPreprocessor
 
-	func = SimputilsStandardPreprocessor()
+	return SimputilsStandardPreprocessor.instance().run(k, v, replace_pattern, replaced_with)
 
-	return func(k, v, replace_pattern, replaced_with)
+
+def identity_pp(k: str, v: Any):
+	"""
+	Preprocessor that returns key and value intact (used when no preprocessor is specified)
+
+	Merging strategies recognize it to skip preprocessing of the incoming data completely
+	"""
+	return k, v
+
+
+def accept_all_filter(k: str, v: Any):
+	"""
+	Filter that accepts everything (used when no filter is specified)
+
+	Merging strategies recognize it to skip filtering of the incoming data completely
+	"""
+	return True
 
 
 def simputils_cast(k: str, v: Any):
 	from simputils.config.components.preprocessors import SimputilsCastingPreprocessor
 
-	func = SimputilsCastingPreprocessor()
-
-	return func(k, v)
+	return k, SimputilsCastingPreprocessor.instance().cast(v)
 
 
 def simputils_pp_with_cast(k: str, v: Any, replace_pattern=r"[^0-9a-zA-Z_]+", replaced_with="_"):
@@ -77,3 +91,64 @@ def get_enum_all_annotations(enum_class):
 		if annotated_config_data:
 			res[m] = annotated_config_data
 	return res
+
+
+def get_enum_casters(enum_class) -> dict:
+	"""
+	Extracts key -> tuple of types (members of the union or a single type) to cast values to,
+	only for the keys annotated with `type`
+
+	:param enum_class:
+	:return:
+	"""
+	res = {}
+	for m, annotated_config_data in get_enum_all_annotations(enum_class).items():
+		annotated_data = annotated_config_data.data
+		if annotated_data and annotated_data.get("type"):
+			res[m.value] = get_args(annotated_data["type"]) or (annotated_data["type"],)
+	return res
+
+
+def get_enum_coercion_plan(enum_class, pydantic_base_model_class=None, casters: dict = None) -> dict:
+	"""
+	Compiles key -> converter of a value to the annotated type, only for the keys annotated with `type`
+
+	The first callable member of the union is used, pydantic models (if `pydantic_base_model_class` is supplied)
+	are validated with `model_validate()`
+
+	:param enum_class:
+	:param pydantic_base_model_class:
+	:param casters: Already extracted casters of `enum_class` (see `get_enum_casters()`), extracted if not supplied
+	:return:
+	"""
+	if casters is None:
+		casters = get_enum_casters(enum_class)
+
+	res = {}
+	for key, like_union in casters.items():
+		converter = _get_enum_converter(like_union, pydantic_base_model_class)
+		if converter is not None:
+			res[key] = converter
+	return res
+
+
+def _get_enum_converter(like_union: tuple, pydantic_base_model_class=None):
+	for subtype in like_union:
+		if not callable(subtype):
+			continue
+		if pydantic_base_model_class and isinstance(subtype, type) and issubclass(subtype, pydantic_base_model_class):
+			return _get_model_converter(subtype)
+		return subtype
+	return None
+
+
+def _get_model_converter(model):
+	# NOTE  `parse_obj()` is for pydantic v1
+	validate = getattr(model, "model_validate", None) or model.parse_obj
+
+	def _converter(val):
+		if isinstance(val, model):
+			return val
+		return validate(val)
+
+	return _converter
@@ -1,8 +1,17 @@
+import inspect
+from contextlib import nullcontext
+from typing import TYPE_CHECKING
+
+from simputils.config.components.FileHandlersIndex import FileHandlersIndex
 from simputils.config.components.handlers import YamlFileHandler, JsonFileHandler, DotEnvFileHandler
 from simputils.config.exceptions import NoAvailableHandlers, NoHandler
-from simputils.config.models import ConfigStore
+from simputils.config.models import ConfigStore, ParsedFile
 from simputils.config.types import HandlerType, ConfigType, FileType, SourceType
 
+if TYPE_CHECKING:  # pragma: no cover
+	import asyncio
+	from concurrent.futures import ThreadPoolExecutor, Future
+
 
 class ConfigHub:
 	"""
@@ -18,12 +27,15 @@ class ConfigHub:
 		YamlFileHandler(),
 		DotEnvFileHandler(),
 	]
+	_file_handlers_index: FileHandlersIndex = None
+	_parse_file_usable: dict[type, bool] = {}
 
 	@classmethod
 	def aggregate(
 		cls,
 		*args: ConfigType | FileType | callable,
-		target: ConfigStore = None
+		target: ConfigStore = None,
+		parallel: bool | int = False,
 	) -> "ConfigStore":
 		"""
 		Aggregate configs from multiple sources.
@@ -31,24 +43,189 @@ class ConfigHub:
 		Just list file paths, dict, etc. and it will aggregate values from all of those
 		sources to a single config
 
+		If `parallel` is set, files are read and parsed concurrently in a thread pool
+		(`int` value is the max number of threads), but merged strictly in the order of `args`.
+		Callables are always called sequentially during merging.
+
 		:param args:
 		:param target:
+		:param parallel:
 		:return:
 		"""
 		if target is None:  # pragma: no cover
 			target = ConfigStore()
 
-		for arg in args:
-			if callable(arg):
-				# NOTE	Processing callable source
-				arg = arg(target)
-				if not arg:
-					continue
+		with cls._prepare_executor(parallel) as executor:
+			preloaded = cls._preload_files(executor, args) if executor else {}
+
+			for index, arg in enumerate(args):
+				target = cls._aggregate_arg(target, arg, preloaded.get(index))
+
+		return target
+
+	@classmethod
+	def _aggregate_arg(cls, target, arg, preloaded: "Future" = None):
+		if callable(arg):
+			# NOTE	Processing callable source
+			arg = arg(target)
+			if not arg:
+				return target
+
+		if preloaded is not None:
+			return cls._fill_up_target_from_parsed(target, arg, preloaded.result())
+
+		return cls._fill_up_target(target, arg)
+
+	@classmethod
+	def _prepare_executor(cls, parallel: bool | int):
+		if not parallel:
+			return nullcontext()
+		# NOTE  Imported on first use to not slow down import of the package
+		from concurrent.futures import ThreadPoolExecutor
+
+		max_workers = None if parallel is True else parallel
+		return ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="simputils-config")
+
+	@classmethod
+	def _preload_files(cls, executor: "ThreadPoolExecutor", args) -> dict[int, "Future"]:
+		"""
+		Submits parsing of all the file args to the executor
+
+		:param executor:
+		:param args:
+		:return: dict of arg index -> future of parsed `ConfigStore` (or None)
+		"""
+		preloaded = {}
+		for index, arg in enumerate(args):
+			if not callable(arg) and isinstance(arg, FileType):
+				preloaded[index] = executor.submit(cls._parse_file, cls._get_available_handlers(), arg)
+
+		return preloaded
+
+	@classmethod
+	def _fill_up_target_from_parsed(
+		cls,
+		target,
+		file: FileType,
+		parsed: ParsedFile | None,
+		name: str = None,
+		source: SourceType = None,
+		type: str = None,
+	):
+		is_handled, target = cls._apply_parsed(parsed, target, name, source, type)
+
+		if not cls.skip_files_with_missing_handler and not is_handled:
+			raise NoHandler(f"No handler for {file} is found")
+
+		return target
+
+	@classmethod
+	async def aaggregate(
+		cls,
+		*args: ConfigType | FileType | callable,
+		target: ConfigStore = None,
+	) -> "ConfigStore":
+		"""
+		Asyncio version of `aggregate()`
+
+		Files are read and parsed in threads (off the event loop) concurrently,
+		but merged strictly in the order of `args`.
+		Callables can be async (returning awaitable), they are called sequentially during merging.
+
+		:param args:
+		:param target:
+		:return:
+		"""
+		if target is None:  # pragma: no cover
+			target = ConfigStore()
 
-			target = cls._fill_up_target(target, arg)
+		preloaded = cls._apreload_files(args)
+		try:
+			for index, arg in enumerate(args):
+				target = await cls._aaggregate_arg(target, arg, preloaded.get(index))
+		finally:
+			cls._cancel_preloaded(preloaded.values())
 
 		return target
 
+	@classmethod
+	def _apreload_files(cls, args) -> dict[int, "asyncio.Future"]:
+		"""
+		Starts parsing of all the file args in threads
+
+		:param args:
+		:return: dict of arg index -> future of parsed `ConfigStore` (or None)
+		"""
+		import asyncio
+
+		preloaded = {}
+		for index, arg in enumerate(args):
+			if not callable(arg) and isinstance(arg, FileType):
+				preloaded[index] = asyncio.ensure_future(
+					asyncio.to_thread(cls._parse_file, cls._get_available_handlers(), arg)
+				)
+
+		return preloaded
+
+	@classmethod
+	async def _aaggregate_arg(cls, target, arg, preloaded: "asyncio.Future" = None):
+		if callable(arg):
+			# NOTE	Processing callable source (sync or async)
+			arg = await cls._acall_source(target, arg)
+			if not arg:
+				return target
+			if isinstance(arg, FileType):
+				return await cls.aconfig_from_file(arg, target=target)
+
+		if preloaded is not None:
+			return cls._fill_up_target_from_parsed(target, arg, await preloaded)
+
+		return cls._fill_up_target(target, arg)
+
+	@classmethod
+	async def _acall_source(cls, target, arg: callable):
+		res = arg(target)
+		if inspect.isawaitable(res):
+			res = await res
+		return res
+
+	@classmethod
+	def _cancel_preloaded(cls, futures):
+		for future in futures:
+			if not future.done():
+				future.cancel()
+			elif not future.cancelled():
+				# NOTE  Marking exception as retrieved, it was either raised already or is irrelevant
+				future.exception()
+
+	@classmethod
+	async def aconfig_from_file(
+		cls,
+		file: FileType,
+		name: str = None,
+		source: SourceType = None,
+		type: str = None,
+		target: ConfigStore = None,
+		handler: HandlerType = None
+	):
+		"""
+		Asyncio version of `config_from_file()`, the file is read and parsed in a thread (off the event loop)
+
+		:param file:
+		:param name:
+		:param source:
+		:param type:
+		:param target:
+		:param handler:
+		:return:
+		"""
+		import asyncio
+
+		available_handlers = cls._get_available_handlers(handler)
+		parsed = await asyncio.to_thread(cls._parse_file, available_handlers, file, type)
+
+		return cls._fill_up_target_from_parsed(target, file, parsed, name, source, type)
+
 	@classmethod
 	def _fill_up_target(cls, target, arg):
 
@@ -114,11 +291,7 @@ class ConfigHub:
 		:param handler:
 		:return:
 		"""
-		available_handlers = cls.file_handlers
-		if handler:
-			available_handlers = [handler, ]
-		if not available_handlers:
-			raise NoAvailableHandlers("No file handlers specified")
+		available_handlers = cls._get_available_handlers(handler)
 
 		is_handled, target = cls._handle(available_handlers, file, target, name, source, type)
 
@@ -127,26 +300,88 @@ class ConfigHub:
 
 		return target
 
+	@classmethod
+	def _get_available_handlers(cls, handler: HandlerType = None) -> list[HandlerType]:
+		available_handlers = cls.file_handlers
+		if handler:
+			available_handlers = [handler, ]
+		if not available_handlers:
+			raise NoAvailableHandlers("No file handlers specified")
+
+		return available_handlers
+
 	@classmethod
 	def _handle(cls, available_handlers, file, target, name, source, type):
-		is_handled = False
-		for h in available_handlers:
-			sub_res: ConfigStore | None = h(file)
-			if sub_res is not None:
-				if name is None:
-					name = sub_res.name
-				if source is None:
-					source = sub_res.source
-				if type is None:
-					type = sub_res.type
-
-				is_handled = True
-
-				if target is None:
-					target = sub_res
-				else:  # pragma: no cover
-					target.config_apply(sub_res, name, source, type)
-
-				break
-
-		return is_handled, target
+		parsed = cls._parse_file(available_handlers, file, type)
+		return cls._apply_parsed(parsed, target, name, source, type)
+
+	@classmethod
+	def _get_handlers_index(cls, available_handlers: list[HandlerType]) -> FileHandlersIndex:
+		"""
+		Returns index of handlers, the index of `file_handlers` is built once and rebuilt only if
+		`file_handlers` are changed
+
+		:param available_handlers:
+		:return:
+		"""
+		index = cls._file_handlers_index
+		if index is None or not index.is_built_for(available_handlers):
+			index = FileHandlersIndex(available_handlers)
+			if available_handlers is cls.file_handlers:
+				cls._file_handlers_index = index
+
+		return index
+
+	@classmethod
+	def _parse_file(cls, available_handlers, file, type: str = None) -> ParsedFile | None:
+		for h in cls._get_handlers_index(available_handlers).get_handlers(file, type):
+			parsed = cls._parse_with_handler(h, file)
+			if parsed is not None:
+				return parsed
+
+		return None
+
+	@classmethod
+	def _parse_with_handler(cls, handler: HandlerType, file: FileType) -> ParsedFile | None:
+		if cls._is_parse_file_usable(handler):
+			return handler.parse_file(file)
+
+		# NOTE  Plain callable handlers (and handlers with custom `process_file()`) return `ConfigStore`
+		sub_res: ConfigStore | None = handler(file)
+		if sub_res is None:
+			return None
+		return ParsedFile.from_config_store(sub_res)
+
+	@classmethod
+	def _is_parse_file_usable(cls, handler: HandlerType) -> bool:
+		"""
+		`parse_file()` is used only if `process_file()` is not overridden below the class implementing
+		`parse_file()`, otherwise custom `process_file()` of the handler would be skipped
+
+		:param handler:
+		:return:
+		"""
+		handler_class = type(handler)
+		res = cls._parse_file_usable.get(handler_class)
+		if res is None:
+			mro = handler_class.__mro__
+			parse_index = next((i for i, c in enumerate(mro) if "parse_file" in c.__dict__), None)
+			process_index = next((i for i, c in enumerate(mro) if "process_file" in c.__dict__), len(mro))
+			res = cls._parse_file_usable[handler_class] = parse_index is not None and parse_index <= process_index
+		return res
+
+	@classmethod
+	def _apply_parsed(cls, parsed: ParsedFile | None, target, name, source, type):
+		if parsed is None:
+			return False, target
+
+		name = parsed.name if name is None else name
+		source = parsed.source if source is None else source
+		type = parsed.type if type is None else type
+
+		if target is None:
+			target = ConfigStore(name=name, source=source, type=type, handler=parsed.handler)
+
+		parsed.apply_to(target, name, source, type)
+
+		return True, target
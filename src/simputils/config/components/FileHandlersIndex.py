@@ -0,0 +1,77 @@
+import os
+from io import IOBase
+
+from simputils.config.types import HandlerType, FileType
+
+
+class FileHandlersIndex:
+	"""
+	Index of file handlers by file extensions and declared config types
+
+	Handlers declaring `FILE_EXTENSIONS` are picked by the extension of the file with a single lookup.
+	Handlers without declared extensions (custom handlers or plain callables) are probed for any file path.
+	All the picked handlers are tried in the original order, so if a declaring handler returns None,
+	the following ones (declaring the same extension or without declared extensions) are still tried.
+
+	For `IOBase` inputs the handler is picked by the declared config type (`supported_types()`)
+	if it's specified, otherwise all the handlers are probed in the original order.
+	"""
+
+	_handlers: tuple[HandlerType, ...] = None
+	_by_extension: dict[str, tuple[HandlerType, ...]] = None
+	_by_type: dict[str, HandlerType] = None
+	_undeclared: tuple[HandlerType, ...] = None
+
+	def __init__(self, handlers: list[HandlerType]):
+		self._handlers = tuple(handlers)
+		self._undeclared = tuple(h for h in self._handlers if not self._get_extensions(h))
+		self._by_extension = {}
+		self._by_type = {}
+
+		for handler in self._handlers:
+			for ext in self._get_extensions(handler):
+				if ext not in self._by_extension:
+					self._by_extension[ext] = self._pick_for_extension(ext)
+
+			for config_type in self._get_types(handler):
+				self._by_type.setdefault(config_type, handler)
+
+	def _pick_for_extension(self, ext: str) -> tuple[HandlerType, ...]:
+		res = []
+		for handler in self._handlers:
+			extensions = self._get_extensions(handler)
+			if not extensions or ext in extensions:
+				res.append(handler)
+		return tuple(res)
+
+	@classmethod
+	def _get_extensions(cls, handler: HandlerType) -> tuple[str, ...]:
+		return getattr(handler, "FILE_EXTENSIONS", None) or ()
+
+	@classmethod
+	def _get_types(cls, handler: HandlerType) -> tuple[str, ...]:
+		supported_types = getattr(handler, "supported_types", None)
+		return supported_types() if supported_types else ()
+
+	def is_built_for(self, handlers: list[HandlerType]) -> bool:
+		"""
+		Checks if the index reflects exactly the same handlers in the same order
+
+		:param handlers:
+		:return:
+		"""
+		return len(handlers) == len(self._handlers) and all(a is b for a, b in zip(handlers, self._handlers))
+
+	def get_handlers(self, file: FileType, type: str = None) -> tuple[HandlerType, ...]:
+		"""
+		Returns handlers to try for the file (in order)
+
+		:param file:
+		:param type:
+		:return:
+		"""
+		if isinstance(file, IOBase):
+			handler = self._by_type.get(type)
+			return (handler, ) if handler else self._handlers
+
+		return self._by_extension.get(os.path.splitext(file)[1], self._undeclared)
@@ -1 +1,2 @@
+from .FileHandlersIndex import FileHandlersIndex
 from .ConfigHub import ConfigHub
@@ -0,0 +1,90 @@
+from collections import OrderedDict
+from typing import Any, Callable
+
+
+class KeyNormalizationCache:
+	"""
+	Bounded LRU cache of "raw key" -> "preprocessed key"
+
+	Used by `ConfigStore` to avoid running the preprocessor on every single read/write of a key.
+	The cache is bound to a preprocessor, if the preprocessor is changed, the cache is dropped.
+
+	`max_size` of `0` disables caching completely (preprocessor is called every time).
+	"""
+
+	_max_size: int = None
+	_storage: OrderedDict = None
+	_preprocessor: Callable = None
+
+	hits: int = 0
+	misses: int = 0
+
+	@property
+	def max_size(self) -> int:
+		return self._max_size
+
+	def __init__(self, max_size: int = 1024):
+		self._max_size = max_size
+		self._storage = OrderedDict()
+		self.hits = 0
+		self.misses = 0
+
+	def normalize(self, key: Any, preprocessor: Callable) -> Any:
+		"""
+		Returns preprocessed key, taking it from cache if possible
+
+		:param key:
+		:param preprocessor:
+		:return:
+		"""
+		if preprocessor is not self._preprocessor:
+			self.invalidate()
+			self._preprocessor = preprocessor
+
+		storage = self._storage
+		res = storage.get(key, storage)
+		if res is not storage:
+			self.hits += 1
+			self._touch(key)
+			return res
+
+		self.misses += 1
+		res, _ = preprocessor(key, None)
+		self._put(key, res)
+
+		return res
+
+	def _touch(self, key: Any):
+		try:
+			self._storage.move_to_end(key)
+		except KeyError:  # pragma: no cover
+			# NOTE  Evicted in between by another thread, the value is still valid
+			pass
+
+	def _put(self, key: Any, val: Any):
+		if not self._max_size:
+			return
+		storage = self._storage
+		storage[key] = val
+		if len(storage) > self._max_size:
+			storage.popitem(last=False)
+
+	def invalidate(self):
+		"""
+		Drops all the cached keys (counters stay intact)
+		"""
+		self._storage.clear()
+
+	def keys(self):
+		return self._storage.keys()
+
+	def info(self) -> dict:
+		return {
+			"hits": self.hits,
+			"misses": self.misses,
+			"size": len(self._storage),
+			"max_size": self._max_size,
+		}
+
+	def __len__(self):
+		return len(self._storage)
@@ -0,0 +1,174 @@
+import os
+from collections import OrderedDict
+from os.path import realpath
+from threading import Lock
+from typing import Any, Callable, Hashable
+
+from simputils.config.types import FileType
+
+
+class ParsedFilesCache:
+	"""
+	Process-wide bounded LRU cache of parsed config files
+
+	Entries are keyed on the real path of a file (and the handler's parsing settings),
+	and are valid as long as the file's stat (mtime, size, inode) is the same.
+	If `content_hash` is enabled, the hash of the file content is additionally checked
+	(the file is read on every access then, but parsed only once).
+
+	Every access returns a fresh copy of mutable containers (dicts, lists, sets) of the parsed data,
+	so modifications of the returned data never affect the cache.
+	Shared and self-referencing containers (like YAML anchors) stay shared in the copy.
+
+	Thread-safe.
+	"""
+
+	_max_size: int = None
+	_content_hash: bool = False
+	_storage: OrderedDict = None
+	_lock: Lock = None
+
+	hits: int = 0
+	misses: int = 0
+
+	@property
+	def max_size(self) -> int:
+		return self._max_size
+
+	@property
+	def content_hash(self) -> bool:
+		return self._content_hash
+
+	def __init__(self, max_size: int = 128, content_hash: bool = False):
+		self._max_size = max_size
+		self._content_hash = content_hash
+		self._storage = OrderedDict()
+		self._lock = Lock()
+		self.hits = 0
+		self.misses = 0
+
+	def get_or_parse(
+		self,
+		file: FileType,
+		parse: Callable[[bytes], Any],
+		parser_key: Hashable = None,
+		read: Callable[[str], bytes] = None,
+	) -> Any:
+		"""
+		Returns parsed data of the file, parsing it only if it's not cached or the file has changed
+
+		:param file: Path to the file
+		:param parse: Callable receiving bytes of the file and returning parsed data
+		:param parser_key: Hashable identifying parsing settings (different parsers of the same file
+			are cached separately)
+		:param read: Callable reading bytes of the file by path (by default the file is just read)
+		:return:
+		"""
+		path = realpath(file)
+		key = (path, parser_key)
+		stamp, content = self._get_stamp(path)
+
+		with self._lock:
+			entry = self._storage.get(key)
+			is_hit = entry is not None and entry[0] == stamp
+			if is_hit:
+				self.hits += 1
+				self._storage.move_to_end(key)
+			else:
+				self.misses += 1
+
+		if is_hit:
+			return self.copy_data(entry[1])
+
+		if content is None:
+			content = read(path) if read is not None else self._read(path)
+		data = parse(content)
+		self._put(key, stamp, data)
+
+		return self.copy_data(data)
+
+	def _get_stamp(self, path: str) -> tuple[tuple, bytes | None]:
+		st = os.stat(path)
+		stamp = (st.st_mtime_ns, st.st_size, st.st_ino)
+		if not self._content_hash:
+			return stamp, None
+
+		# NOTE  Imported on first use to not slow down import of the package
+		import hashlib
+
+		content = self._read(path)
+		return (*stamp, hashlib.blake2b(content).digest()), content
+
+	@classmethod
+	def _read(cls, path: str) -> bytes:
+		with open(path, "rb") as fd:
+			return fd.read()
+
+	def _put(self, key: tuple, stamp: tuple, data: Any):
+		if not self._max_size:
+			return
+		with self._lock:
+			self._storage[key] = (stamp, data)
+			self._storage.move_to_end(key)
+			if len(self._storage) > self._max_size:
+				self._storage.popitem(last=False)
+
+	def invalidate(self, file: FileType = None):
+		"""
+		Drops cached data of the file, or the whole cache if `file` is not specified
+
+		:param file:
+		:return:
+		"""
+		with self._lock:
+			if file is None:
+				self._storage.clear()
+				return
+			path = realpath(file)
+			for key in [key for key in self._storage if key[0] == path]:
+				del self._storage[key]
+
+	def info(self) -> dict:
+		return {
+			"hits": self.hits,
+			"misses": self.misses,
+			"size": len(self._storage),
+			"max_size": self._max_size,
+		}
+
+	def __len__(self):
+		return len(self._storage)
+
+	@classmethod
+	def copy_data(cls, data: Any) -> Any:
+		"""
+		Copies mutable containers of parsed data, immutable values are shared
+
+		Containers referenced multiple times (including self-references) are copied once,
+		nesting depth is not limited by the recursion limit
+
+		:param data:
+		:return:
+		"""
+		memo = {}
+		stack = []
+		result = cls._copy_container(data, memo, stack)
+		while stack:
+			source, target = stack.pop()
+			keys = source.keys() if isinstance(source, dict) else range(len(source))
+			for key in keys:
+				target[key] = cls._copy_container(source[key], memo, stack)
+		return result
+
+	@classmethod
+	def _copy_container(cls, val: Any, memo: dict, stack: list) -> Any:
+		# NOTE  Returns the copy right away, items of dicts and lists are filled later through the stack
+		if isinstance(val, set):
+			return set(val)
+		if not isinstance(val, (dict, list)):
+			return val
+		copied = memo.get(id(val))
+		if copied is None:
+			copied = memo[id(val)] = {} if isinstance(val, dict) else [None] * len(val)
+			stack.append((val, copied))
+		return copied
@@ -0,0 +1,2 @@
+from .KeyNormalizationCache import KeyNormalizationCache
+from .ParsedFilesCache import ParsedFilesCache
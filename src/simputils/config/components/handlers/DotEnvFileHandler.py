@@ -1,11 +1,11 @@
 import os
-from io import IOBase
-
-import dotenv
+from io import IOBase, StringIO
+from typing import Hashable
 
+from simputils.config.components.parsers import DotEnvParser
 from simputils.config.enums import ConfigStoreType
 from simputils.config.generic import BasicFileHandler
-from simputils.config.models import ConfigStore
+from simputils.config.models import ConfigStore, ParsedFile
 from simputils.config.types import FileType
 
 
@@ -15,28 +15,51 @@ class DotEnvFileHandler(BasicFileHandler):
 	"""
 
 	CONFIG_TYPE: str = ConfigStoreType.DOT_ENV
+	FILE_EXTENSIONS: tuple[str, ...] = (".env", )
 
-	def process_file(self, file: FileType) -> ConfigStore | None:
-		conf = self._prepare_conf(file)
-		if conf is not None:
+	native: bool = False
+	"""
+	If enabled, built-in `DotEnvParser` is used instead of `python-dotenv`
+	"""
+
+	interpolate: bool = True
+	"""
+	Expanding of `${VAR}` and `${VAR:-default}` in values
+	"""
+
+	def __init__(self, native: bool = False, interpolate: bool = True):
+		self.native = native
+		self.interpolate = interpolate
+
+	def _parse_io(self, file: IOBase) -> dict:
+		if self.native:
+			return DotEnvParser(self.interpolate).parse(file.read())
+
+		# NOTE  Imported on first use to not slow down import of the package
+		import dotenv
+
+		return dotenv.dotenv_values(stream=file, interpolate=self.interpolate)
+
+	def _parse_bytes(self, data: bytes) -> dict:
+		if self.native:
+			return DotEnvParser(self.interpolate).parse(data.decode("utf-8"))
+		return self._parse_io(StringIO(data.decode("utf-8")))
+
+	def _parser_key(self) -> Hashable:
+		return self.__class__, self.native, self.interpolate
+
+	def parse_file(self, file: FileType) -> ParsedFile | None:
+		parsed = self._prepare_parsed(file)
+		if parsed is not None:
 
 			if isinstance(file, IOBase):
-				data = dotenv.dotenv_values(stream=file)
-				return conf.config_apply(
-					dict(data),
-					name=conf.name,
-					source=conf.source,
-					type=conf.type,
-					handler=self,
-				)
-			elif os.path.splitext(file)[1] in (".env",):
-				data = dotenv.dotenv_values(file)
-				return conf.config_apply(
-					dict(data),
-					name=conf.name,
-					source=conf.source,
-					type=conf.type,
-					handler=self,
-				)
+				parsed.data = self._parse_io(file)
+				return parsed
+			elif os.path.splitext(file)[1] in self.FILE_EXTENSIONS:
+				parsed.data = self._parse_path_bytes(file, self._parse_bytes)
+				return parsed
 
 		return None  # pragma: no cover
+
+	def process_file(self, file: FileType) -> ConfigStore | None:
+		return self._config_from_parsed(self.parse_file(file))
@@ -1,13 +1,58 @@
+import importlib
 import json
 import os
 from io import IOBase
+from typing import Any, Callable, Hashable
 
-from simputils.config.enums import ConfigStoreType
+from simputils.config.components.streams import JsonItemsStream
+from simputils.config.enums import ConfigStoreType, JsonBackendsEnum
 from simputils.config.exceptions import WrongFormat
 from simputils.config.generic import BasicFileHandler
-from simputils.config.models import ConfigStore
+from simputils.config.models import ConfigStore, ParsedFile
 from simputils.config.types import FileType
 
+_BACKENDS_DECODERS = {
+	JsonBackendsEnum.ORJSON: ("orjson", "loads"),
+	JsonBackendsEnum.MSGSPEC: ("msgspec.json", "decode"),
+	JsonBackendsEnum.UJSON: ("ujson", "loads"),
+}
+
+_AUTO_BACKENDS = (JsonBackendsEnum.ORJSON, JsonBackendsEnum.MSGSPEC)
+
+# NOTE  Backends accepting any buffer (like `memoryview` of `mmap`), not only bytes
+_BUFFER_BACKENDS = frozenset((JsonBackendsEnum.ORJSON, JsonBackendsEnum.MSGSPEC))
+
+# NOTE  Integers out of 64-bit range are not decoded identically by fast backends (might become float),
+#       such numbers are detected by the run of 19 digits in the text with all the digits turned into "0".
+#       The text is checked by chunks, so it's never copied as a whole
+_LONG_NUMBER_DIGITS = 19
+_LONG_NUMBER = "0" * _LONG_NUMBER_DIGITS
+_LONG_NUMBER_BYTES = _LONG_NUMBER.encode()
+_DIGITS_TABLE = str.maketrans(dict.fromkeys("123456789", "0"))
+_DIGITS_TABLE_BYTES = bytes.maketrans(b"123456789", b"000000000")
+_CHECK_CHUNK_SIZE = 1024 * 1024
+
+
+def _import_decoder(backend: str) -> Callable[[bytes], Any]:
+	module_name, func_name = _BACKENDS_DECODERS[JsonBackendsEnum(backend)]
+	return getattr(importlib.import_module(module_name), func_name)
+
+
+def _has_long_number(data: bytes | memoryview | str) -> bool:
+	if isinstance(data, str):
+		table, needle, to_chunk = _DIGITS_TABLE, _LONG_NUMBER, str
+	else:
+		# NOTE  Only a single chunk of a buffer (like `memoryview` of `mmap`) is copied at a time
+		table, needle, to_chunk = _DIGITS_TABLE_BYTES, _LONG_NUMBER_BYTES, bytes
+
+	# NOTE  Chunks overlap, so a run of digits on the border of chunks is not missed
+	overlap = _LONG_NUMBER_DIGITS - 1
+	for start in range(0, len(data), _CHECK_CHUNK_SIZE):
+		if needle in to_chunk(data[max(start - overlap, 0):start + _CHECK_CHUNK_SIZE]).translate(table):
+			return True
+
+	return False
+
 
 class JsonFileHandler(BasicFileHandler):
 	"""
@@ -15,27 +60,132 @@ class JsonFileHandler(BasicFileHandler):
 	"""
 
 	CONFIG_TYPE: str = ConfigStoreType.JSON
+	FILE_EXTENSIONS: tuple[str, ...] = (".json", )
+
+	streaming: bool = False
+	"""
+	If enabled, top-level key/value pairs are parsed and applied one by one instead of loading the whole file
+	"""
+
+	backend: str | Callable[[bytes], Any] = JsonBackendsEnum.AUTO
+	"""
+	JSON decoder used for files (`JsonBackendsEnum` value or a callable receiving bytes)
+	"""
+
+	_decoder: Callable[[bytes], Any] | None = None
+	_is_decoder_buffer_capable: bool = False
+	_is_decoder_resolved: bool = False
+
+	def __init__(
+		self,
+		streaming: bool = False,
+		backend: str | Callable[[bytes], Any] = JsonBackendsEnum.AUTO,
+	):
+		self.streaming = streaming
+		self.backend = backend
+
+	def _get_decoder(self) -> Callable[[bytes], Any] | None:
+		"""
+		Returns decoder of the backend, or None for stdlib `json`
 
-	def _prepare_from_io(self, file: IOBase, conf: ConfigStore):
-		data = json.load(file)
+		Resolved on first use, so backends are not imported until the first JSON file is parsed
+		"""
+		if not self._is_decoder_resolved:
+			self._decoder, self._is_decoder_buffer_capable = self._resolve_decoder(self.backend)
+			self._is_decoder_resolved = True
+		return self._decoder
+
+	@classmethod
+	def _resolve_decoder(
+		cls,
+		backend: str | Callable[[bytes], Any],
+	) -> tuple[Callable[[bytes], Any] | None, bool]:
+		"""
+		Returns decoder of the backend (None for stdlib `json`) and whether it accepts buffers
+		"""
+		if callable(backend):
+			return backend, False
+		if backend == JsonBackendsEnum.AUTO:
+			return cls._detect_decoder()
+		if backend == JsonBackendsEnum.STDLIB:
+			return None, False
+		return _import_decoder(backend), backend in _BUFFER_BACKENDS
+
+	@classmethod
+	def _detect_decoder(cls) -> tuple[Callable[[bytes], Any] | None, bool]:
+		for backend in _AUTO_BACKENDS:
+			try:
+				return _import_decoder(backend), backend in _BUFFER_BACKENDS
+			except ImportError:
+				continue
+
+		return None, False
+
+	def _is_buffer_parsing_supported(self) -> bool:
+		self._get_decoder()
+		return self._is_decoder_buffer_capable
+
+	def _parser_key(self) -> Hashable:
+		return self.__class__, self.backend
+
+	def _parse_io(self, file: IOBase) -> dict:
+		return self._parse_bytes(file.read())
+
+	def _parse_bytes(self, data: bytes | memoryview | str) -> dict:
+		return self._check_root(self._decode(data))
+
+	def _decode(self, data: bytes | memoryview | str) -> Any:
+		"""
+		Decodes through the backend, falling back to stdlib `json` if the backend fails or might be inaccurate,
+		so the results (and errors) are always the same as of stdlib `json`
+		"""
+		decoder = self._get_decoder()
+		if decoder is not None and not _has_long_number(data):
+			try:
+				return decoder(data)
+			except Exception:
+				# NOTE  NaN, Infinity, BOM, lone surrogates, etc. are not supported by some backends
+				pass
+
+		if isinstance(data, memoryview):
+			# NOTE  Stdlib `json` does not accept buffers
+			data = bytes(data)
+		return json.loads(data)
+
+	# noinspection PyMethodMayBeStatic
+	def _check_root(self, data) -> dict:
 		if not isinstance(data, dict):
 			# MARK  Overlapping error and try/catch that should not catch this error
 			raise WrongFormat("JSON file format root element must be dict")
-		return conf.config_apply(
-			dict(data),
-			name=conf.name,
-			source=conf.source,
-			type=conf.type,
-			handler=self,
-		)
+		return data
 
-	def process_file(self, file: FileType) -> ConfigStore | None:
-		conf = self._prepare_conf(file)
-		if conf is not None:
+	def parse_file(self, file: FileType) -> ParsedFile | None:
+		if self.streaming:
+			return self._stream_file(file)
+
+		parsed = self._prepare_parsed(file)
+		if parsed is not None:
 			if isinstance(file, IOBase):
-				return self._prepare_from_io(file, conf)
-			elif os.path.splitext(file)[1] in (".json", ):
-				with open(file, "r") as fd:
-					return self._prepare_from_io(fd, conf)
+				parsed.data = self._parse_io(file)
+				return parsed
+			elif os.path.splitext(file)[1] in self.FILE_EXTENSIONS:
+				parsed.data = self._parse_path_bytes(file, self._parse_bytes)
+				return parsed
 
 		return None
+
+	def _stream_file(self, file: FileType) -> ParsedFile | None:
+		parsed = self._prepare_parsed(file)
+		if parsed is not None:
+			parsed.is_stream = True
+			if isinstance(file, IOBase):
+				parsed.data = iter(JsonItemsStream(file))
+				return parsed
+			elif os.path.splitext(file)[1] in self.FILE_EXTENSIONS:
+				parsed.data = self._stream_path(file, JsonItemsStream)
+				return parsed
+
+		return None
+
+	def process_file(self, file: FileType) -> ConfigStore | None:
+		return self._config_from_parsed(self.parse_file(file))
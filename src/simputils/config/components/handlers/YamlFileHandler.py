@@ -1,11 +1,11 @@
 import os
 from io import IOBase
+from typing import Hashable
 
-import yaml
-
+from simputils.config.components.streams import YamlItemsStream
 from simputils.config.enums import ConfigStoreType
 from simputils.config.generic import BasicFileHandler
-from simputils.config.models import ConfigStore
+from simputils.config.models import ConfigStore, ParsedFile
 from simputils.config.types import FileType
 
 
@@ -15,30 +15,79 @@ class YamlFileHandler(BasicFileHandler):
 	"""
 
 	CONFIG_TYPE: str = ConfigStoreType.YAML
+	FILE_EXTENSIONS: tuple[str, ...] = (".yml", ".yaml")
+
+	streaming: bool = False
+	"""
+	If enabled, top-level key/value pairs are parsed and applied one by one instead of loading the whole file
+	"""
+
+	use_libyaml: bool = True
+	"""
+	If enabled and PyYAML is built with libyaml, C-accelerated `CSafeLoader` is used instead of `SafeLoader`
+	(the same safe subset of YAML tags is supported). Streaming mode always uses `SafeLoader`
+	"""
+
+	def __init__(self, streaming: bool = False, use_libyaml: bool = True):
+		self.streaming = streaming
+		self.use_libyaml = use_libyaml
+
+	def _get_loader_class(self) -> type:
+		# NOTE  Imported on first use to not slow down import of the package
+		import yaml
+
+		if self.use_libyaml:
+			return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+		return yaml.SafeLoader
+
+	def _parser_key(self) -> Hashable:
+		return self.__class__, self._get_loader_class()
+
+	def _parse_io(self, file: IOBase):
+		return self._load(file)
+
+	def _parse_bytes(self, data: bytes):
+		return self._load(data)
+
+	def _load(self, stream: IOBase | bytes):
+		# NOTE  The same as `yaml.safe_load()`, but with the configured loader class
+		loader = self._get_loader_class()(stream)
+		try:
+			return loader.get_single_data()
+		finally:
+			loader.dispose()
+
+	def parse_file(self, file: FileType) -> ParsedFile | None:
+		if self.streaming:
+			return self._stream_file(file)
 
-	def process_file(self, file: FileType) -> ConfigStore | None:
 		# NOTE  For some weird reason PyYAML parsing json successfully.
 		#       It is unreasonable architecturally, so JSONs are explicitly excluded
 
-		conf = self._prepare_conf(file)
-		if conf is not None:
+		parsed = self._prepare_parsed(file)
+		if parsed is not None:
 
 			if isinstance(file, IOBase):
-				return conf.config_apply(
-					yaml.safe_load(file),
-					name=conf.name,
-					source=conf.source,
-					type=conf.type,
-					handler=self,
-				)
-			elif os.path.splitext(file)[1] in (".yml", ".yaml"):
-				with open(file, "r") as fd:
-					return conf.config_apply(
-						yaml.safe_load(fd),
-						name=conf.name,
-						source=conf.source,
-						type=conf.type,
-						handler=self,
-					)
+				parsed.data = self._parse_io(file)
+				return parsed
+			elif os.path.splitext(file)[1] in self.FILE_EXTENSIONS:
+				parsed.data = self._parse_path_bytes(file, self._parse_bytes)
+				return parsed
 
 		return None
+
+	def _stream_file(self, file: FileType) -> ParsedFile | None:
+		parsed = self._prepare_parsed(file)
+		if parsed is not None:
+			parsed.is_stream = True
+			if isinstance(file, IOBase):
+				parsed.data = iter(YamlItemsStream(file))
+				return parsed
+			elif os.path.splitext(file)[1] in self.FILE_EXTENSIONS:
+				parsed.data = self._stream_path(file, YamlItemsStream)
+				return parsed
+
+		return None
+
+	def process_file(self, file: FileType) -> ConfigStore | None:
+		return self._config_from_parsed(self.parse_file(file))
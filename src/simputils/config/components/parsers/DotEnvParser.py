@@ -0,0 +1,154 @@
+import codecs
+import os
+import re
+
+_BINDING = re.compile(
+	r"""
+	\s*
+	(?=(?P<export>(?:export[^\S\r\n]+)?))(?P=export)
+	(?:'(?P<quoted_key>[^']+)'|(?P<key>[^=\#\s]+)|(?=\#))
+	[^\S\r\n]*
+	(?:
+		(?P<equal_sign>=[^\S\r\n]*)
+		(?:
+			'(?P<single_quoted>(?:\\.|[^'\\])*)'
+			|"(?P<double_quoted>(?:\\.|[^"\\])*)"
+			|(?P<unquoted>[^\r\n]*)
+		)
+	)?
+	(?:[^\S\r\n]*\#[^\r\n]*)?
+	[^\S\r\n]*(?:\r\n|\n|\r|$)
+	""",
+	re.VERBOSE | re.DOTALL,
+)
+_BINDING_START = re.compile(r"\s*(?=(?P<export>(?:export[^\S\r\n]+)?))(?P=export)")
+_SINGLE_QUOTED_KEY = re.compile(r"'[^']+'")
+_SINGLE_QUOTED = re.compile(r"'(?:\\.|[^'\\])*'", re.DOTALL)
+_DOUBLE_QUOTED = re.compile(r'"(?:\\.|[^"\\])*"', re.DOTALL)
+_QUOTED_KEYS = {"'": _SINGLE_QUOTED_KEY}
+_QUOTED_VALUES = {"'": _SINGLE_QUOTED, "\"": _DOUBLE_QUOTED}
+_REST_OF_LINE = re.compile(r"[^\r\n]*(?:\r\n|\n|\r)?")
+_INLINE_COMMENT = re.compile(r"\s+#.*")
+_SINGLE_QUOTE_ESCAPES = re.compile(r"\\[\\']")
+_DOUBLE_QUOTE_ESCAPES = re.compile(r"\\[\\'\"abfnrtv]")
+_VARIABLE = re.compile(r"\$\{(?P<name>[^}:]*)(?::-(?P<default>[^}]*))?}")
+
+
+def _decode_escape(match: re.Match) -> str:
+	return codecs.decode(match.group(0), "unicode-escape")
+
+
+class DotEnvParser:
+	"""
+	Native single-pass parser of .env files
+
+	Alternative to `dotenv.dotenv_values()` giving the same results for the common syntax:
+	`export` prefix, quoted keys, single/double-quoted (multiline) and unquoted values, comments,
+	keys without values (`None`) and `${VAR}`/`${VAR:-default}` interpolation (if enabled).
+	Invalid lines are skipped.
+	"""
+
+	_interpolate: bool = True
+
+	@property
+	def interpolate(self) -> bool:
+		return self._interpolate
+
+	def __init__(self, interpolate: bool = True):
+		self._interpolate = interpolate
+
+	def parse(self, text: str) -> dict[str, str | None]:
+		"""
+		Parses content of .env file
+
+		:param text:
+		:return: dict of key -> value (None for keys without "=")
+		"""
+		res = {}
+		pos = 0
+		length = len(text)
+		if text.startswith("\ufeff"):
+			pos = 1
+
+		while pos < length:
+			pos = self._parse_binding(text, pos, res)
+
+		return res
+
+	def _parse_binding(self, text: str, pos: int, res: dict) -> int:
+		"""
+		Parses a single binding starting at `pos` into `res`
+
+		:return: position of the next binding
+		"""
+		match = _BINDING.match(text, pos)
+		if match is None or match.end() == pos:
+			return self._skip_invalid(text, _BINDING_START.match(text, pos).end(), _QUOTED_KEYS)
+
+		key = match.group("quoted_key") or match.group("key")
+		if key is not None and key[0] == "'":
+			return self._skip_invalid(text, match.start("key"), _QUOTED_KEYS)
+
+		value = self._get_value(match)
+		if value is False:
+			return self._skip_invalid(text, match.start("unquoted"), _QUOTED_VALUES)
+
+		if key is not None:
+			res[key] = self._interpolate_value(res, value)
+
+		return match.end()
+
+	@classmethod
+	def _skip_invalid(cls, text: str, pos: int, quoted_patterns: dict[str, re.Pattern]) -> int:
+		"""
+		Skips the rest of invalid binding, starting from the key or value at `pos`
+
+		Quoted key or value is skipped completely first (it might be multiline)
+		"""
+		quoted_pattern = quoted_patterns.get(text[pos:pos + 1])
+		if quoted_pattern is not None:
+			quoted = quoted_pattern.match(text, pos)
+			if quoted is not None:
+				pos = quoted.end()
+		return _REST_OF_LINE.match(text, pos).end()
+
+	@classmethod
+	def _get_value(cls, match: re.Match) -> str | None | bool:
+		equal_sign = match.group("equal_sign")
+		if equal_sign is None:
+			return None
+
+		value = match.group("single_quoted")
+		if value is not None:
+			return _SINGLE_QUOTE_ESCAPES.sub(_decode_escape, value) if "\\" in value else value
+
+		value = match.group("double_quoted")
+		if value is not None:
+			return _DOUBLE_QUOTE_ESCAPES.sub(_decode_escape, value) if "\\" in value else value
+
+		return cls._get_unquoted_value(match.group("unquoted"), len(equal_sign) > 1)
+
+	@classmethod
+	def _get_unquoted_value(cls, value: str, is_spaced: bool) -> str | bool:
+		if value[:1] in ("'", "\""):
+			return False
+		if "#" in value:
+			if is_spaced and value[0] == "#":
+				# NOTE  "KEY= # comment" is an empty value with a comment
+				return ""
+			value = _INLINE_COMMENT.sub("", value)
+		return value.rstrip()
+
+	def _interpolate_value(self, res: dict, value: str | None) -> str | None:
+		if value is None or not self._interpolate or "${" not in value:
+			return value
+		return _VARIABLE.sub(lambda m: self._resolve_variable(res, m), value)
+
+	@classmethod
+	def _resolve_variable(cls, res: dict, match: re.Match) -> str:
+		name = match.group("name")
+		if name in res:
+			value = res[name]
+		else:
+			value = os.environ.get(name, match.group("default") or "")
+		return "" if value is None else value
@@ -0,0 +1 @@
+from .DotEnvParser import DotEnvParser
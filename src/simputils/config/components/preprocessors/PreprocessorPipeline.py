@@ -0,0 +1,185 @@
+from time import perf_counter
+from typing import Any, Callable
+
+from simputils.config.generic import BasicPreprocessor
+from simputils.config.types import PreProcessorType
+
+
+class _KeysStage:
+	"""
+	Adjacent key-only stages fused into a single one with memoized keys
+	"""
+
+	__slots__ = ("parts", "name", "_keys", "_cache_size")
+
+	def __init__(self, parts: list, cache_size: int):
+		self.parts = parts
+		self.name = f"keys({', '.join(_stage_name(part) for part in parts)})"
+		self._keys = {}
+		self._cache_size = cache_size
+
+	def process_key(self, k: Any) -> Any:
+		for part in self.parts:
+			if isinstance(part, dict):
+				k = part.get(k, k)
+			else:
+				k, _ = part(k, None)
+		return k
+
+	def __call__(self, k: Any, v: Any) -> tuple[Any, Any]:
+		keys = self._keys
+		res = keys.get(k, keys)
+		if res is keys:
+			res = self.process_key(k)
+			if len(keys) < self._cache_size:
+				keys[k] = res
+		return res, v
+
+
+def _stage_name(stage: Any) -> str:
+	if isinstance(stage, dict):
+		return "rename"
+	return getattr(stage, "name", None) or getattr(stage, "__name__", None) or type(stage).__name__
+
+
+def _merge_renames(first: dict, second: dict) -> dict:
+	"""
+	Merges 2 sequentially applied renames into a single one
+
+	:param first:
+	:param second:
+	:return:
+	"""
+	res = {old_key: second.get(new_key, new_key) for old_key, new_key in first.items()}
+	for old_key, new_key in second.items():
+		res.setdefault(old_key, new_key)
+	return res
+
+
+class PreprocessorPipeline(BasicPreprocessor):
+	"""
+	Chain of preprocessors compiled into a sequence of stages
+
+	At construction nested lists are flattened, adjacent renames (`dict` preprocessors) are merged
+	into a single mapping, and adjacent key-only stages (renames and preprocessors with `keys_only`)
+	are fused into a single stage with memoized keys (up to `cache_size` keys).
+
+	If `timing` is enabled, calls and time spent are counted per stage (see `info()`)
+	"""
+
+	_stages: tuple = None
+	_calls: list = None
+	_seconds: list = None
+	_timing: bool = False
+
+	@property
+	def stages(self) -> tuple:
+		return self._stages
+
+	@property
+	def timing(self) -> bool:
+		return self._timing
+
+	def __init__(self, preprocessors: PreProcessorType, cache_size: int = 4096, timing: bool = False):
+		self._stages = tuple(self._compile(self._flatten(preprocessors), cache_size))
+		self._timing = timing
+		self.reset_timings()
+
+	@classmethod
+	def _flatten(cls, preprocessors: PreProcessorType) -> list:
+		if preprocessors is None:
+			return []
+		if isinstance(preprocessors, dict):
+			return [preprocessors]
+		if isinstance(preprocessors, (tuple, list)):
+			return [part for sub in preprocessors for part in cls._flatten(sub)]
+
+		return cls._known_parts(preprocessors)
+
+	@classmethod
+	def _known_parts(cls, preprocessor: Callable) -> list:
+		"""
+		Replaces shortcut functions with the reusable preprocessor objects, so they can be fused
+
+		:param preprocessor:
+		:return:
+		"""
+		from simputils.config.base import simputils_pp, simputils_cast, simputils_pp_with_cast
+		from simputils.config.components.preprocessors import SimputilsStandardPreprocessor, \
+			SimputilsCastingPreprocessor
+
+		if preprocessor is simputils_pp:
+			return [SimputilsStandardPreprocessor.instance()]
+		if preprocessor is simputils_cast:
+			return [SimputilsCastingPreprocessor.instance()]
+		if preprocessor is simputils_pp_with_cast:
+			return [SimputilsStandardPreprocessor.instance(), SimputilsCastingPreprocessor.instance()]
+
+		return [preprocessor]
+
+	@classmethod
+	def _compile(cls, parts: list, cache_size: int) -> list:
+		stages = []
+		keys_parts = []
+		for part in parts:
+			if isinstance(part, dict) or getattr(part, "keys_only", False) is True:
+				cls._add_keys_part(keys_parts, part)
+				continue
+
+			if keys_parts:
+				stages.append(_KeysStage(keys_parts, cache_size))
+				keys_parts = []
+			stages.append(part)
+
+		if keys_parts:
+			stages.append(_KeysStage(keys_parts, cache_size))
+
+		return stages
+
+	@classmethod
+	def _add_keys_part(cls, keys_parts: list, part: dict | Callable):
+		if not isinstance(part, dict):
+			keys_parts.append(part)
+		elif keys_parts and isinstance(keys_parts[-1], dict):
+			keys_parts.append(_merge_renames(keys_parts.pop(), part))
+		else:
+			keys_parts.append(dict(part))
+
+	def run(self, k: str, v: Any, *args, **kwargs) -> tuple[str, Any]:
+		if self._timing:
+			return self._run_timed(k, v)
+
+		for stage in self._stages:
+			k, v = stage(k, v)
+		return k, v
+
+	__call__ = run
+
+	def _run_timed(self, k: str, v: Any) -> tuple[str, Any]:
+		calls = self._calls
+		seconds = self._seconds
+		for i, stage in enumerate(self._stages):
+			started = perf_counter()
+			k, v = stage(k, v)
+			seconds[i] += perf_counter() - started
+			calls[i] += 1
+		return k, v
+
+	def reset_timings(self):
+		self._calls = [0] * len(self._stages)
+		self._seconds = [0.0] * len(self._stages)
+
+	def info(self) -> list[dict]:
+		"""
+		Returns per-stage counters (calls and seconds are counted only if `timing` is enabled)
+
+		:return:
+		"""
+		return [
+			{
+				"stage": _stage_name(stage),
+				"calls": calls,
+				"seconds": seconds,
+			}
+			for stage, calls, seconds in zip(self._stages, self._calls, self._seconds)
+		]
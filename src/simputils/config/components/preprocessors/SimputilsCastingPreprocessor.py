@@ -1,15 +1,40 @@
 import re
-from typing import Any
+from typing import Any, Mapping
 
 from simputils.config.generic import BasicPreprocessor
 
+_NUMBER = re.compile(r"^[+-]?(?:(?P<int>[0-9]+)|[0-9]+\.[0-9]*|\.[0-9]+)$")
+_MISSING = object()
+
 
 class SimputilsCastingPreprocessor(BasicPreprocessor):
+	"""
+	Casts string values to bool, None, int and float
+
+	Values are looked up (case-insensitively) in a table built from `list_yes`, `list_no` and `list_none`,
+	numbers are matched with a single precompiled pattern.
+	If the lists are redefined, the table is rebuilt automatically on the next use,
+	after in-place modifications of the lists `rebuild()` must be called
+	"""
 
 	list_yes = ["yes", "y", "t", "true", "+", "enable", "enabled", "on"]
 	list_no = ["no", "n", "f", "false", "-", "disable", "disabled", "off"]
 	list_none = ["null", "none", "nil", ""]
 
+	_instance: "SimputilsCastingPreprocessor" = None
+
+	_values_table_state: tuple[tuple, dict, int] = None
+
+	@classmethod
+	def instance(cls) -> "SimputilsCastingPreprocessor":
+		"""
+		Returns reusable (shared) instance of the preprocessor
+		"""
+		instance = cls.__dict__.get("_instance")
+		if instance is None:
+			cls._instance = instance = cls()
+		return instance
+
 	def run(
 		self,
 		k: str,
@@ -17,41 +42,106 @@ class SimputilsCastingPreprocessor(BasicPreprocessor):
 		*args,
 		**kwargs
 	) -> tuple[str, Any]:
+		return k, self.cast(v)
+
+	def __call__(self, k: str, v: Any, *args, **kwargs):
+		return k, self.cast(v)
+
+	def cast(self, v: Any) -> Any:
+		"""
+		Casts a single value (only strings are processed)
+
+		:param v:
+		:return:
+		"""
+		if not isinstance(v, str):
+			return v
+
+		# NOTE  Inlined `_get_values_table()`, this is the hottest path
+		state = self._values_table_state
+		if state is None or not self._is_state_actual(state):
+			state = self.rebuild()
+		_, table, max_len = state
+		if len(v) <= max_len:
+			res = table.get(v.lower(), _MISSING)
+			if res is not _MISSING:
+				return res
+
+		return self._cast_number(v)
 
-		if isinstance(v, str):
-			# NOTE	Only strings are being processed
-			value = v.lower()
+	def cast_many(self, mapping: Mapping) -> dict:
+		"""
+		Casts all the values of the mapping at once
 
-			# NOTE	Binary Option Values
-			sub_res = self._process_binary_option_values(k, value)
-			if sub_res is not None:
-				return sub_res
+		:param mapping:
+		:return: new dict with casted values
+		"""
+		table, max_len = self._get_values_table()
+		cast_with = self._cast_with
+		return {
+			key: cast_with(val, table, max_len) if isinstance(val, str) else val
+			for key, val in mapping.items()
+		}
 
-			# NOTE	Numbers
-			sub_res = self._process_number_values(k, value)
-			if sub_res is not None:
-				return sub_res
+	def rebuild(self) -> tuple[tuple, dict, int]:
+		"""
+		Rebuilds the values table from `list_yes`, `list_no` and `list_none`
 
-		return k, v
+		Redefined lists are noticed automatically, but after in-place modifications of them
+		this method must be called explicitly
+
+		:return: the new state (lists, table, max length of the values in the table)
+		"""
+		lists = (self.list_yes, self.list_no, self.list_none)
+		table = {}
+		# NOTE  The order matters, in case of the same value in multiple lists, the latest one wins
+		for values, res in zip(lists, (True, False, None)):
+			table.update(dict.fromkeys(frozenset(value.lower() for value in values), res))
+
+		# NOTE  Published as a single tuple, so the table and its max length are always consistent
+		self._values_table_state = state = (lists, table, max(map(len, table), default=0))
+		return state
+
+	def _cast_with(self, v: str, table: dict, max_len: int) -> Any:
+		if len(v) <= max_len:
+			res = table.get(v.lower(), _MISSING)
+			if res is not _MISSING:
+				return res
+
+		return self._cast_number(v)
+
+	@classmethod
+	def _cast_number(cls, value: str) -> Any:
+		matched = _NUMBER.match(value)
+		if matched is None:
+			return value
+		if matched.group("int") is not None:
+			return int(value)
+		return float(value)
+
+	def _get_values_table(self) -> tuple[dict, int]:
+		"""
+		Returns the values table and max length of the values in it (longer strings can't be found there)
+
+		The table is rebuilt if any of the lists were redefined (checked by identity)
+
+		:return:
+		"""
+		state = self._values_table_state
+		if state is None or not self._is_state_actual(state):
+			state = self.rebuild()
+		return state[1], state[2]
+
+	def _is_state_actual(self, state: tuple) -> bool:
+		lists = state[0]
+		return lists[0] is self.list_yes and lists[1] is self.list_no and lists[2] is self.list_none
 
 	# noinspection PyMethodMayBeStatic
 	def _process_number_values(self, key, value):
-		res = None
-		if re.match(r"^[+-]?[0-9.]+$", value) and value.count(".") == 1:
-			# MARK  Fix the multiple dots check!
-			res = (key, float(value))
-		if re.match(r"^[+-]?[0-9]+$", value):
-			res = (key, int(value))
-
-		return res
+		res = self._cast_number(value)
+		return None if res is value else (key, res)
 
 	def _process_binary_option_values(self, key, value):
-		res = None
-		if value in self.list_yes:
-			res = (key, True)
-		if value in self.list_no:
-			res = (key, False)
-		if value in self.list_none:
-			res = (key, None)
-
-		return res
+		table, _ = self._get_values_table()
+		res = table.get(value, _MISSING)
+		return None if res is _MISSING else (key, res)
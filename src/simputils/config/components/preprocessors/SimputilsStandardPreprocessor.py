@@ -5,13 +5,65 @@ from simputils.config.generic import BasicPreprocessor
 
 
 class SimputilsStandardPreprocessor(BasicPreprocessor):
+	"""
+	Standard Simputils Preprocessor
+
+	* Turns keys to uppercase
+	* Replaces all non-alphanumeric with underscores on keys (and replaces multiple underscores with one)
+
+	The pattern is compiled once, and the transformed keys are memoized (up to `cache_size` keys),
+	so the object can be used directly as `preprocessor` of `ConfigStore`
+	"""
+
+	keys_only: bool = True
+
+	DEFAULT_REPLACE_PATTERN: str = r"[^0-9a-zA-Z_]+"
+	DEFAULT_REPLACED_WITH: str = "_"
+
+	_instance: "SimputilsStandardPreprocessor" = None
+
+	_replace_pattern: str = None
+	_replaced_with: str = None
+	_compiled_pattern: re.Pattern = None
+	_cache_size: int = None
+	_keys: dict = None
+
+	@property
+	def replace_pattern(self) -> str:
+		return self._replace_pattern
+
+	@property
+	def replaced_with(self) -> str:
+		return self._replaced_with
+
+	@classmethod
+	def instance(cls) -> "SimputilsStandardPreprocessor":
+		"""
+		Returns reusable (shared) instance of the preprocessor with default settings
+		"""
+		instance = cls.__dict__.get("_instance")
+		if instance is None:
+			cls._instance = instance = cls()
+		return instance
+
+	def __init__(
+		self,
+		replace_pattern: str = DEFAULT_REPLACE_PATTERN,
+		replaced_with: str = DEFAULT_REPLACED_WITH,
+		cache_size: int = 4096,
+	):
+		self._replace_pattern = replace_pattern
+		self._replaced_with = replaced_with
+		self._compiled_pattern = re.compile(replace_pattern)
+		self._cache_size = cache_size
+		self._keys = {}
 
 	def run(
 		self,
 		k: str,
 		v: Any,
-		replace_pattern=r"[^0-9a-zA-Z_]+",
-		replaced_with="_",
+		replace_pattern=None,
+		replaced_with=None,
 		*args,
 		**kwargs
 	) -> tuple[str, Any]:
@@ -21,12 +73,39 @@ class SimputilsStandardPreprocessor(BasicPreprocessor):
 		* Turns keys to uppercase
 		* Replaces all non-alphanumeric with underscores on keys (and replaces multiple underscores with one)
 
-		:param replaced_with:
-		:param replace_pattern:
+		:param replaced_with: Overrides the configured one for this call only
+		:param replace_pattern: Overrides the configured one for this call only
 		:param k:
 		:param v:
 		:return:
 		"""
-		k = re.sub(replace_pattern, replaced_with, k).upper()
+		if (replace_pattern is None or replace_pattern == self._replace_pattern) \
+			and (replaced_with is None or replaced_with == self._replaced_with):
+			return self.process_key(k), v
+
+		replace_pattern = self._replace_pattern if replace_pattern is None else replace_pattern
+		replaced_with = self._replaced_with if replaced_with is None else replaced_with
+		return re.sub(replace_pattern, replaced_with, k).upper(), v
+
+	def __call__(self, k: str, v: Any, *args, **kwargs):
+		if args or kwargs:
+			return self.run(k, v, *args, **kwargs)
+
+		res = self._keys.get(k)
+		if res is None:
+			res = self.process_key(k)
+		return res, v
+
+	def process_key(self, k: str) -> str:
+		"""
+		Returns transformed key (memoized)
 
-		return k, v
+		:param k:
+		:return:
+		"""
+		res = self._keys.get(k)
+		if res is None:
+			res = self._compiled_pattern.sub(self._replaced_with, k).upper()
+			if len(self._keys) < self._cache_size:
+				self._keys[k] = res
+		return res
@@ -1,2 +1,3 @@
 from .SimputilsCastingPreprocessor import SimputilsCastingPreprocessor
 from .SimputilsStandardPreprocessor import SimputilsStandardPreprocessor
+from .PreprocessorPipeline import PreprocessorPipeline
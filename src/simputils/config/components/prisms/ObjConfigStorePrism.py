@@ -1,4 +1,3 @@
-import inspect
 from typing import Any
 
 from simputils.config.enums import ConfigStoreType
@@ -22,33 +21,34 @@ class ObjConfigStorePrism:  # pragma: no cover
 
     def __setattr__(self, key, value):
         if key not in ("_config_store", ) and key not in self.__dict__:
-            self._config_store[key] = value
+            self._set_single_value(key, value)
         else:
             self.__dict__[key] = value
 
     def __setitem__(self, key, value):
-        preprocessor = self._config_store._preprocessor
-        key, _ = preprocessor(key, None)
+        self._set_single_value(key, value)
+
+    def _set_single_value(self, key, value):
+        key = self._config_store._normalize_key(key)
 
         if self._config_store._strict_keys and key not in self._config_store:
             raise StrictKeysEnabled(
                 f"Strict Keys mode enabled. Only initial set of keys allowed. Key \"{key}\" is unknown")
 
-        frame_context = inspect.stack()[1][0]
-        frame_info = inspect.getframeinfo(frame_context)
+        # NOTE  Depth 3 is the caller of `__setitem__` or `__setattr__`
+        name, source = self._config_store._get_call_site(3)
 
         self._config_store.config_apply(
             {key: value},
-            f"{frame_info.function}:{frame_info.lineno}",
-            frame_info.filename,
+            name,
+            source,
             ConfigStoreType.SINGLE_VALUE
         )
 
     def __add__(self, other):  # pragma: no cover
         if self._config_store._strict_keys:
             for key in other:
-                preprocessor = self._config_store._preprocessor
-                key, _ = preprocessor(key, None)
+                key = self._config_store._normalize_key(key)
                 if key not in self._config_store:
                     raise StrictKeysEnabled(
                         f"Strict Keys mode enabled. Only initial set of keys allowed. Key \"{key}\" is unknown"
@@ -65,8 +65,7 @@ class ObjConfigStorePrism:  # pragma: no cover
         del self._config_store[key]
 
     def __getitem__(self, key):
-        preprocessor = self._config_store._preprocessor
-        key, _ = preprocessor(key, None)
+        key = self._config_store._normalize_key(key)
 
         if self._config_store._strict_keys and key not in self._config_store:
             raise StrictKeysEnabled(
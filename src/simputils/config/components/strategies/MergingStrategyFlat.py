@@ -8,3 +8,12 @@ class MergingStrategyFlat(BasicMergingStrategy):
 		if not isinstance(val_target, NotExisting) and none_considered_empty and val_incoming is None:
 			return val_target
 		return val_incoming
+
+	def apply_data_bulk(self, storage: dict, config: dict, none_considered_empty: bool = False) -> dict:
+		if not none_considered_empty:
+			return config
+
+		return {
+			key: storage.get(key) if val_incoming is None else val_incoming
+			for key, val_incoming in config.items()
+		}
@@ -1,92 +1,188 @@
+import copy
+
 from simputils.config.components.simpletons import NotExisting
 from simputils.config.generic import BasicMergingStrategy
 
+# NOTE  Kinds of values, decide how a pair of values is merged
+_REPLACED = 0
+_SEQUENCE = 1
+_MAPPING = 2
+_OBJECT = 3
 
-class MergingStrategyRecursive(BasicMergingStrategy):
+_KINDS: dict[type, int] = {
+	NotExisting: _REPLACED,
+	int: _REPLACED,
+	float: _REPLACED,
+	bool: _REPLACED,
+	str: _REPLACED,
+	list: _SEQUENCE,
+	tuple: _SEQUENCE,
+	dict: _MAPPING,
+}
 
-	_list_extend: bool = None
 
-	def __init__(self, list_extend: bool = False):
-		self._list_extend = list_extend
+def _detect_kind(type_: type) -> int:
+	if issubclass(type_, (NotExisting, int, float, bool, str)):
+		return _REPLACED
+	if issubclass(type_, (list, tuple)):
+		return _SEQUENCE
+	if issubclass(type_, dict):
+		return _MAPPING
+	if getattr(type_, "__dictoffset__", 0):
+		return _OBJECT
 
-	# noinspection PyUnusedLocal
-	@classmethod
-	def _none_check(cls, val_target, val_incoming):
-		res = val_incoming is None
-		return res
+	# NOTE  Objects without `__dict__` can not be merged field by field
+	return _REPLACED
 
-	# noinspection PyUnusedLocal
-	@classmethod
-	def _not_existing_check(cls, val_target, val_incoming):
-		res = val_target is not None and isinstance(val_target, NotExisting)
-		return res
 
-	@classmethod
-	def _primitive_check(cls, val_target, val_incoming):
-		primitives = (int, float, bool, str)
-		res = val_target is not None and val_incoming is not None and \
-			(isinstance(val_target, primitives) or isinstance(val_incoming, primitives))
-		return res
+def _get_kind(type_: type) -> int:
+	kind = _KINDS.get(type_)
+	if kind is None:
+		kind = _KINDS[type_] = _detect_kind(type_)
+	return kind
 
-	@classmethod
-	def _incompatible_check(cls, val_target, val_incoming):
-		# NOTE  If the val_target class != val_incoming class and val_target is not derivative of val_incoming.
-		check = isinstance(val_target, object) and isinstance(val_incoming, object) and \
-			not isinstance(val_target, val_incoming.__class__)
-		if check:
-			return True
 
-		return False
+def _copy_mapping(val: dict) -> dict:
+	if type(val) is dict:
+		return val.copy()
+	return copy.copy(val)
+
+
+class MergingStrategyRecursive(BasicMergingStrategy):
+	"""
+	Merges nested dicts and objects (their `__dict__`) key by key
+
+	Merging is iterative (with an explicit stack), so the depth of the data is not limited by the recursion limit.
+	Target dicts and objects are modified in place, unless `copy_on_write` is enabled.
+	With `copy_on_write` only the dicts and objects along the changed paths are copied (shallowly),
+	unchanged sub-values are shared, so the merged sources and previous values are never modified.
+
+	With `list_extend` a list is copied once, when the strategy takes ownership of it, and then the owned copy
+	is extended in place by the following merges, so lists supplied by callers are never modified.
+	With `copy_on_write` the ownership lasts for a single `merge()` call only
+	"""
+
+	_list_extend: bool = None
+	_copy_on_write: bool = False
+	_owned_lists: dict[int, list] = None
+	"""
+	Lists created by the strategy (id -> list), they can be extended in place.
+	The lists are referenced, so their ids are never reused by other objects
+	"""
+
+	@property
+	def copy_on_write(self) -> bool:
+		return self._copy_on_write
+
+	def __init__(self, list_extend: bool = False, copy_on_write: bool = False):
+		self._list_extend = list_extend
+		self._copy_on_write = copy_on_write
+		self._owned_lists = {}
 
 	def merge(self, key, val_target, val_incoming, none_considered_empty: bool = False):
-		resulting_val = val_incoming
 		if not isinstance(val_target, NotExisting) and none_considered_empty and val_incoming is None:
-			resulting_val = val_target
-		# NOTE  internally recursion happens
-		main_args = (val_target, val_incoming)
-		check = self._none_check(*main_args) or \
-			self._not_existing_check(*main_args) or \
-			self._primitive_check(*main_args) or \
-			self._incompatible_check(*main_args)
-
-		if check:
+			return val_target
+
+		stack = []
+		copies = {} if self._copy_on_write else None
+		res = self._merge_value(val_target, val_incoming, stack, copies)
+		if stack:
+			self._merge_stack(stack, copies)
+
+		return res
+
+	def _merge_stack(self, stack: list, copies: dict | None):
+		mergers = self._MERGERS
+		merged_pairs = set()
+		while stack:
+			kind, val_target, val_incoming = stack.pop()
+			pair = (id(val_target), id(val_incoming))
+			if pair not in merged_pairs:
+				# NOTE  Prevents endless merging of self-referencing data
+				merged_pairs.add(pair)
+				mergers[kind](self, val_target, val_incoming, stack, copies)
+
+	def _merge_value(self, val_target, val_incoming, stack: list, copies: dict | None):
+		"""
+		Returns the merged value, dicts and objects are only scheduled for merging (through `stack`)
+		and returned as is (or as a copy if `copies` is supplied), because they are merged in place
+
+		:param val_target:
+		:param val_incoming:
+		:param stack:
+		:param copies: (target, incoming) ids -> copy of target, when copy-on-write is enabled
+		:return:
+		"""
+		if val_incoming is None or val_target is None:
+			return val_incoming
+
+		kind = _get_kind(type(val_target))
+		if kind is _REPLACED or _get_kind(type(val_incoming)) is _REPLACED \
+			or not isinstance(val_target, val_incoming.__class__):
 			# NOTE  uses incoming value if not-existing key, primitives or incompatible formats
 			#       basically any inconsistency, then the whole value is used of val_incoming
-			return resulting_val
+			return self._replace(kind, val_target, val_incoming)
+
+		if kind is _SEQUENCE:
+			return self._sequences_merge(val_target, val_incoming, copies)
+
+		if copies is not None:
+			return self._copy_scheduled(kind, val_target, val_incoming, stack, copies)
+
+		stack.append((kind, val_target, val_incoming))
+		return val_target
 
-		if isinstance(val_target, (list, tuple)) or isinstance(val_incoming, (list, tuple)):
-			if self._list_extend:
-				return val_target + val_incoming
+	def _replace(self, kind: int, val_target, val_incoming):
+		if kind is _SEQUENCE:
+			# NOTE  Replaced owned list is not referenced by the strategy anymore
+			self._owned_lists.pop(id(val_target), None)
+		return val_incoming
 
+	@classmethod
+	def _copy_scheduled(cls, kind: int, val_target, val_incoming, stack: list, copies: dict):
+		pair = (id(val_target), id(val_incoming))
+		res = copies.get(pair)
+		if res is None:
+			res = copies[pair] = _copy_mapping(val_target) if kind is _MAPPING else copy.copy(val_target)
+			stack.append((kind, res, val_incoming))
+		return res
+
+	def _sequences_merge(self, val_target: list | tuple, val_incoming: list | tuple, copies: dict | None):
+		if not self._list_extend:
 			return val_incoming
 
-		if isinstance(val_target, dict) and isinstance(val_incoming, dict):
-			return self._dictionaries_merge(*main_args)
+		if type(val_target) is not list:
+			return val_target + val_incoming
 
-		check = (isinstance(val_target, object) and isinstance(val_incoming, object)) or \
-			(isinstance(val_target, dict) and isinstance(val_incoming, object)) or \
-			(isinstance(val_target, object) and isinstance(val_incoming, dict))
-		if check:
-			return self._objects_merge(*main_args)
+		# NOTE  Only the lists created by the strategy are extended in place, the rest might be referenced
+		#       from the sources or the history, so they are copied once.
+		#       With copy-on-write the ownership is limited by the `merge()` call (`copies` are int keyed then)
+		owned = self._owned_lists if copies is None else copies
+		if owned.get(id(val_target)) is not val_target:
+			val_target = val_target.copy()
+			owned[id(val_target)] = val_target
 
-		# NOTE  overrides the target value with the incoming one
-		return resulting_val  # pragma: no cover
+		val_target.extend(val_incoming)
+		return val_target
 
-	def _dictionaries_merge(self, val_target: dict, val_incoming: dict):
+	def _dictionaries_merge(self, val_target: dict, val_incoming: dict, stack: list, copies: dict | None):
+		merge_value = self._merge_value
 		for key, val_in in val_incoming.items():
 			if key in val_target:
-				val_target[key] = self.merge(key, val_target[key], val_in)
+				val_target[key] = merge_value(val_target[key], val_in, stack, copies)
 			else:
 				val_target[key] = val_in
 
-		return val_target
-
-	def _objects_merge(self, val_target: object, val_incoming: object):
+	def _objects_merge(self, val_target: object, val_incoming: object, stack: list, copies: dict | None):
+		merge_value = self._merge_value
+		target_dict = val_target.__dict__
 		for key, val_in in val_incoming.__dict__.items():
-			if key in val_target.__dict__:
-				sub_val = self.merge(key, val_target.__dict__[key], val_in)
-				if sub_val is None:
-					sub_val = val_target.__dict__[key]
-				val_target.__dict__[key] = sub_val
-
-		return val_target
+			if key in target_dict:
+				sub_val = merge_value(target_dict[key], val_in, stack, copies)
+				if sub_val is not None:
+					target_dict[key] = sub_val
+
+	_MERGERS = {
+		_MAPPING: _dictionaries_merge,
+		_OBJECT: _objects_merge,
+	}
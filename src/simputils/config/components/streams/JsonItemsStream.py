@@ -0,0 +1,108 @@
+import json
+import re
+from typing import Any, IO, Iterator
+
+from simputils.config.exceptions import WrongFormat
+
+_WHITESPACES = re.compile(r"[ \t\n\r]*")
+_DELIMITERS = frozenset(" \t\n\r,:}]")
+
+
+class JsonItemsStream:
+	"""
+	Iterates over top-level key/value pairs of JSON object incrementally
+
+	The file is read by chunks, and only the currently decoded value is kept in memory
+	(plus the read-ahead buffer), so the whole document is never materialized.
+	"""
+
+	_file: IO = None
+	_chunk_size: int = None
+	_decoder: json.JSONDecoder = None
+	_buffer: str = ""
+	_pos: int = 0
+	_eof: bool = False
+
+	def __init__(self, file: IO, chunk_size: int = 65536):
+		self._file = file
+		self._chunk_size = chunk_size
+		self._decoder = json.JSONDecoder()
+		self._buffer = ""
+		self._pos = 0
+		self._eof = False
+
+	def __iter__(self) -> Iterator[tuple[str, Any]]:
+		self._expect("{")
+		if self._peek() == "}":
+			self._next_char()
+		else:
+			yield from self._iter_items()
+
+		if self._peek():
+			raise WrongFormat("JSON file contains extra data after the root element")
+
+	def _iter_items(self) -> Iterator[tuple[str, Any]]:
+		while True:
+			key = self._decode()
+			if not isinstance(key, str):
+				raise WrongFormat("JSON object keys must be strings")
+			self._expect(":")
+			yield key, self._decode()
+
+			separator = self._next_char()
+			if separator == "}":
+				return
+			if separator != ",":
+				raise WrongFormat(f"JSON object items must be separated by \",\", got \"{separator}\"")
+
+	def _fill(self):
+		"""
+		Reads the next chunk, dropping already consumed part of the buffer
+
+		At least as much as already pending in the buffer is read, so re-decoding of a big value
+		spread over many chunks stays linear
+		"""
+		pending = self._buffer[self._pos:]
+		chunk = self._file.read(max(self._chunk_size, len(pending)))
+		if not chunk:
+			self._eof = True
+		self._buffer = pending + chunk
+		self._pos = 0
+
+	def _peek(self) -> str:
+		"""
+		Skips whitespaces and returns the next char without consuming it (empty string at the end)
+		"""
+		while True:
+			self._pos = _WHITESPACES.match(self._buffer, self._pos).end()
+			if self._pos < len(self._buffer) or self._eof:
+				return self._buffer[self._pos:self._pos + 1]
+			self._fill()
+
+	def _next_char(self) -> str:
+		char = self._peek()
+		self._pos += len(char)
+		return char
+
+	def _expect(self, expected: str):
+		char = self._next_char()
+		if char != expected:
+			raise WrongFormat(f"JSON file format: expected \"{expected}\", got \"{char}\"")
+
+	def _decode(self) -> Any:
+		self._peek()
+		while True:
+			res = self._try_decode()
+			# NOTE  Value not followed by a delimiter might be truncated by the chunk border (like numbers)
+			if res is not None and (self._eof or self._buffer[res[1]:res[1] + 1] in _DELIMITERS):
+				self._pos = res[1]
+				return res[0]
+			self._fill()
+
+	def _try_decode(self) -> tuple[Any, int] | None:
+		try:
+			return self._decoder.raw_decode(self._buffer, self._pos)
+		except json.JSONDecodeError:
+			if self._eof:
+				raise
+			return None
@@ -0,0 +1,78 @@
+from typing import Any, IO, Iterator
+
+from simputils.config.exceptions import WrongFormat
+
+
+class YamlItemsStream:
+	"""
+	Iterates over top-level key/value pairs of YAML mapping incrementally
+
+	The document is processed event by event, only the currently constructed
+	value is composed into nodes and objects.
+
+	Top-level merge keys (`<<`) are not supported in this mode
+	"""
+
+	_file: IO = None
+	_loader_class: type = None
+
+	def __init__(self, file: IO, loader_class: type = None):
+		self._file = file
+		self._loader_class = loader_class
+
+	def __iter__(self) -> Iterator[tuple[Any, Any]]:
+		# NOTE  Imported on first use to not slow down import of the package
+		import yaml
+
+		loader = (self._loader_class or yaml.SafeLoader)(self._file)
+		try:
+			if self._start_mapping(loader, yaml):
+				while not loader.check_event(yaml.MappingEndEvent):
+					yield self._construct(loader), self._construct(loader)
+				loader.get_event()
+			self._end_stream(loader, yaml)
+		finally:
+			loader.dispose()
+
+	def _start_mapping(self, loader, yaml) -> bool:
+		"""
+		Consumes events up to the root mapping start
+
+		:return: False if the document is empty
+		"""
+		loader.get_event()
+		if loader.check_event(yaml.StreamEndEvent):
+			return False
+
+		loader.get_event()
+		if loader.check_event(yaml.MappingStartEvent):
+			loader.get_event()
+			return True
+
+		if self._construct(loader) is None:
+			return False
+
+		raise WrongFormat("YAML file format root element must be dict")
+
+	# noinspection PyMethodMayBeStatic
+	def _end_stream(self, loader, yaml):
+		"""
+		Consumes events up to the stream end, the same as `yaml.safe_load()` only a single document is allowed
+		"""
+		if loader.check_event(yaml.DocumentEndEvent):
+			loader.get_event()
+		if not loader.check_event(yaml.StreamEndEvent):
+			event = loader.get_event()
+			raise yaml.composer.ComposerError(
+				"expected a single document in the stream", None,
+				"but found another document", event.start_mark,
+			)
+
+	# noinspection PyMethodMayBeStatic
+	def _construct(self, loader) -> Any:
+		node = loader.compose_node(None, None)
+		res = loader.construct_object(node, deep=True)
+		# NOTE  Constructed objects are dropped right away, only the anchors are kept (aliases might refer them)
+		loader.constructed_objects = {}
+		loader.recursive_objects = {}
+		return res
@@ -0,0 +1,2 @@
+from .JsonItemsStream import JsonItemsStream
+from .YamlItemsStream import YamlItemsStream
@@ -0,0 +1,22 @@
+from enum import Enum
+
+
+class JsonBackendsEnum(str, Enum):
+	"""
+	JSON decoders supported by `JsonFileHandler`
+	"""
+
+	AUTO = "auto"
+	"""The fastest installed one of `orjson` and `msgspec`, otherwise stdlib `json`"""
+
+	STDLIB = "json"
+	"""Standard library `json`"""
+
+	ORJSON = "orjson"
+	"""`orjson.loads()`"""
+
+	MSGSPEC = "msgspec"
+	"""`msgspec.json.decode()`"""
+
+	UJSON = "ujson"
+	"""`ujson.loads()`"""
@@ -0,0 +1,16 @@
+from enum import Enum
+
+
+class ProvenanceModesEnum(str, Enum):
+	"""
+	How the call-site of single-value assignments is recorded in `ConfigStore` history
+	"""
+
+	OFF = "off"
+	"""Call-site is not recorded at all (name and source are None)"""
+
+	CHEAP = "cheap"
+	"""Function name, line number and file name are taken directly from the caller's frame"""
+
+	FULL = "full"
+	"""Call-site is resolved through `inspect` (source file lookup, slow)"""
@@ -1,2 +1,4 @@
 from .ConfigStoreType import ConfigStoreType
 from .MergingStrategiesEnum import MergingStrategiesEnum
+from .ProvenanceModesEnum import ProvenanceModesEnum
+from .JsonBackendsEnum import JsonBackendsEnum
@@ -0,0 +1,15 @@
+class CoercionFailed(ValueError, TypeError):
+	"""
+	Values of one or more annotated keys could not be coerced to their types
+
+	All the failed keys are collected in `errors` (key -> exception).
+	Subclasses both `ValueError` and `TypeError` (the errors raised by casting before),
+	but not pydantic's `ValidationError`, the original `ValidationError` of a key is available in `errors`
+	"""
+
+	errors: dict = None
+
+	def __init__(self, errors: dict):
+		self.errors = errors
+		details = ", ".join(f"\"{key}\" ({type(e).__name__}: {e})" for key, e in errors.items())
+		super().__init__(f"Values could not be coerced: {details}")
@@ -1,3 +1,4 @@
+from .CoercionFailed import CoercionFailed
 from .NoAvailableHandlers import NoAvailableHandlers
 from .NoHandler import NoHandler
 from .NotPermitted import NotPermitted
@@ -4,7 +4,7 @@ from typing import Any
 from simputils.config.types import SourceType, HandlerType
 
 
-@dataclass
+@dataclass(slots=True)
 class BasicAppliedConf:
 	applied_keys: list[str] = None
 	type: str = None
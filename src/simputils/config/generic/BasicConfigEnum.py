@@ -1,6 +1,6 @@
 from enum import Enum
 
-from simputils.config.base import get_enum_defaults, get_enum_annotation_for, get_enum_all_annotations
+from simputils.config.base import get_enum_all_annotations, get_enum_casters, get_enum_coercion_plan
 from simputils.config.types import SourceType, PreProcessorType, FilterType, HandlerType
 
 
@@ -11,19 +11,63 @@ class BasicConfigEnum(str, Enum):
 	Basically just str + enum with some additional features.
 
 	After extending from it, can be easily used as an argument for defaults of `ConfigStore`
+
+	Defaults, annotations and casters are extracted once per class and cached on the class
 	"""
 
+	@classmethod
+	def _get_config_metadata(cls) -> tuple[dict, dict, dict]:
+		metadata = cls.__dict__.get("_config_metadata")
+		if metadata is None:
+			annotations = get_enum_all_annotations(cls)
+			defaults = {
+				m.value: annotations[m].data.get("default") if m in annotations else None
+				for m in cls
+			}
+			metadata = (defaults, annotations, get_enum_casters(cls))
+			setattr(cls, "_config_metadata", metadata)
+
+		return metadata
+
 	@classmethod
 	def defaults(cls) -> dict:
-		return get_enum_defaults(cls)
+		return dict(cls._get_config_metadata()[0])
 
 	@classmethod
 	def get_annotation_for(cls, name: "BasicConfigEnum | str"):
-		return get_enum_annotation_for(cls, name)
+		return cls._get_config_metadata()[1].get(cls(name))
 
 	@classmethod
 	def get_all_annotations(cls):
-		return get_enum_all_annotations(cls)
+		return dict(cls._get_config_metadata()[1])
+
+	@classmethod
+	def get_casters(cls) -> dict:
+		"""
+		Returns key -> tuple of types to cast values to (shared between calls, must not be modified)
+		"""
+		return cls._get_config_metadata()[2]
+
+	@classmethod
+	def get_coercion_plan(cls, pydantic_base_model_class=None) -> dict:
+		"""
+		Returns key -> converter of a value to the annotated type (compiled once per pydantic base class
+		from the cached `get_casters()`, shared between calls, must not be modified)
+		"""
+		plans = cls.__dict__.get("_coercion_plans")
+		if plans is None:
+			plans = {}
+			setattr(cls, "_coercion_plans", plans)
+
+		plan = plans.get(pydantic_base_model_class)
+		if plan is None:
+			plan = plans[pydantic_base_model_class] = get_enum_coercion_plan(
+				cls,
+				pydantic_base_model_class,
+				cls.get_casters(),
+			)
+
+		return plan
 
 	@classmethod
 	def target_config(
@@ -1,23 +1,29 @@
-import importlib.util
+import fnmatch
 import inspect
+import re
+import sys
 from abc import ABCMeta, abstractmethod
 from argparse import Namespace
-from collections.abc import Iterable
+from collections import deque
+from collections.abc import Iterable, Mapping
 from enum import Enum
 # noinspection PyUnresolvedReferences,PyProtectedMember
 from os import _Environ
-from typing import Any, Callable, get_args
+from typing import Any, Callable
 
-from simputils.config.base import get_enum_defaults, get_enum_all_annotations
+from simputils.config.base import get_enum_defaults, get_enum_coercion_plan, identity_pp, accept_all_filter
+from simputils.config.components.caches import KeyNormalizationCache
 from simputils.config.components.prisms import ObjConfigStorePrism
 from simputils.config.components.strategies import MergingStrategyFlat, MergingStrategyRecursive
-from simputils.config.enums import ConfigStoreType, MergingStrategiesEnum
-from simputils.config.exceptions import NotPermitted, StrictKeysEnabled
-from simputils.config.generic import BasicAppliedConf, BasicMergingStrategy
+from simputils.config.enums import ConfigStoreType, MergingStrategiesEnum, ProvenanceModesEnum
+from simputils.config.exceptions import NotPermitted, StrictKeysEnabled, CoercionFailed
+from simputils.config.generic import BasicAppliedConf, BasicMergingStrategy, BasicConfigEnum
 from simputils.config.types import ConfigType, PreProcessorType, FilterType, SourceType, HandlerType
 
 _type_func = type
 
+_FILTER_GLOB_PREFIX = "glob:"
+
 
 # noinspection PyMissingConstructor
 class BasicConfigStore(dict, metaclass=ABCMeta):
@@ -27,12 +33,13 @@ class BasicConfigStore(dict, metaclass=ABCMeta):
 	_name: str = None
 	_source: SourceType = None
 	_type: str = None
-	_applied_confs: list[BasicAppliedConf] = None
+	_applied_confs: list[BasicAppliedConf] | deque[BasicAppliedConf] = None
+	_provenance_index: dict[str, BasicAppliedConf] = None
 	_storage: dict = None
 	_preprocessor: PreProcessorType = None
 	_filter: FilterType = None
 	_applied_conf_class = None
-	_initial_preprocessed_keys: list[str] = None
+	_initial_preprocessed_keys: set[str] = None
 	_strict_keys: bool = False
 	_strategy: str | BasicMergingStrategy = None
 
@@ -45,11 +52,26 @@ class BasicConfigStore(dict, metaclass=ABCMeta):
 
 	_none_considered_empty: bool = False
 
+	_key_cache: KeyNormalizationCache = None
+
+	_provenance_mode: str = ProvenanceModesEnum.CHEAP
+
+	_history_limit: int | None = None
+	_history_keep_refs: bool = True
+	_history_collapse_single_values: bool = False
+	_collapse_record: BasicAppliedConf | None = None
+	_collapse_keys: set | None = None
+
 	@classmethod
 	@abstractmethod
 	def applied_conf_class(cls):  # pragma: no cover
 		pass
 
+	@classmethod
+	@abstractmethod
+	def frozen_class(cls):  # pragma: no cover
+		pass
+
 	@property
 	def obj(self) -> ObjConfigStorePrism:
 		"""
@@ -77,11 +99,14 @@ class BasicConfigStore(dict, metaclass=ABCMeta):
 		return self._handler
 
 	@property
-	def applied_confs(self) -> list[BasicAppliedConf]:
+	def applied_confs(self) -> list[BasicAppliedConf] | deque[BasicAppliedConf]:
+		"""
+		History records, `collections.deque` if `history_limit` is specified
+		"""
 		return self._applied_confs
 
 	@property
-	def history(self) -> list[BasicAppliedConf]:
+	def history(self) -> list[BasicAppliedConf] | deque[BasicAppliedConf]:
 		"""
 		Alias for `applied_confs`
 		"""
@@ -109,6 +134,20 @@ class BasicConfigStore(dict, metaclass=ABCMeta):
 	def none_considered_empty(self) -> bool:  # pragma: no cover
 		return self._none_considered_empty
 
+	@property
+	def provenance_mode(self) -> str:
+		"""
+		Mode of recording call-site for single-value assignments (see `ProvenanceModesEnum`)
+		"""
+		return self._provenance_mode
+
+	@property
+	def key_cache(self) -> KeyNormalizationCache:
+		"""
+		Cache of preprocessed keys used for reading/writing values by key
+		"""
+		return self._key_cache
+
 	_is_pydantic_enabled: bool = True
 
 	@classmethod
@@ -131,17 +170,25 @@ class BasicConfigStore(dict, metaclass=ABCMeta):
 		none_considered_empty: bool = False,
 		strict_keys: bool = False,
 		strategy: str | BasicMergingStrategy = MergingStrategiesEnum.FLAT,
+		key_cache_size: int = 1024,
+		provenance_mode: str = ProvenanceModesEnum.CHEAP,
+		history_limit: int = None,
+		history_keep_refs: bool = True,
+		history_collapse_single_values: bool = False,
 	):
-		if self._is_pydantic_enabled:
-			self._pydantic_setup()
-
-		self._applied_confs = []
+		self._applied_confs = [] if history_limit is None else deque(maxlen=history_limit)
+		self._provenance_index = {}
 		self._storage = {}
-		self._initial_preprocessed_keys = []
+		self._initial_preprocessed_keys = set()
 		self._strict_keys = strict_keys
 		self._return_default_on_none = return_default_on_none
 		self._applied_conf_class = self.applied_conf_class()
 		self._none_considered_empty = none_considered_empty
+		self._key_cache = KeyNormalizationCache(key_cache_size)
+		self._provenance_mode = provenance_mode
+		self._history_limit = history_limit
+		self._history_keep_refs = history_keep_refs
+		self._history_collapse_single_values = history_collapse_single_values
 
 		self._prepare_strategy(strategy)
 
@@ -184,16 +231,18 @@ class BasicConfigStore(dict, metaclass=ABCMeta):
 
 	@classmethod
 	def _pydantic_setup(cls):
-		try:
-			if not cls._pydantic_base_model_class:
-				pydantic_namespace = importlib.util.find_spec("pydantic")
-				if pydantic_namespace:
-					cls._pydantic_base_model_class = getattr(
-						importlib.import_module("pydantic"),
-						"BaseModel"
-					)
-		except (ModuleNotFoundError, AttributeError):  # pragma: no cover
-			pass
+		"""
+		Resolves pydantic `BaseModel` on first use (when annotated types are processed)
+
+		Pydantic is never imported by the library itself: if it's not imported by the application yet,
+		no type could be a pydantic model, so it's not resolved
+		"""
+		if cls._is_pydantic_enabled and not cls._pydantic_base_model_class:
+			pydantic_module = sys.modules.get("pydantic")
+			if pydantic_module is not None:
+				cls._pydantic_base_model_class = getattr(pydantic_module, "BaseModel", None)
+
+		return cls._pydantic_base_model_class
 
 	def __val_or_val(self, val1: Any | None, val2: Any | None):
 		return val2 if val1 is None else val1
@@ -237,75 +286,61 @@ class BasicConfigStore(dict, metaclass=ABCMeta):
 
 		return values, name, source, type, handler
 
-	def _key_replace_callback(self, mapped_keys: dict[str, str], key: str, val: Any):
-		"""
-		Callback for replacing old key with a new key where `mapped_keys` is {"OLD KEY": "NEW KEY"}
-
-		:param mapped_keys:
-		:param key:
-		:param val:
-		:return:
-		"""
-		if key in mapped_keys:
-			# NOTE  Replacing old key with a new key
-			return mapped_keys[key], val
-		# NOTE  Returning key and val intact
-		return key, val
-
-	def _get_prepare_pp_for_dict(self, preprocessor_data):
-		def _wrapper(k, v):
-			return self._key_replace_callback(preprocessor_data, k, v)
-		return _wrapper
-
-	def _get_prepare_pp_for_list(self, callable_list):
-		def _wrapper(k, v):
-			for cbk in callable_list:
-				k, v = cbk(k, v)
-			return k, v
-		return _wrapper
-
-	def _get_prepare_pp_for_non_callable(self):
-		def _wrapper(k, v):
-			return k, v
-		return _wrapper
-
 	def _prepare_preprocessor(self, preprocessor):
 
-		if isinstance(preprocessor, dict):
-			preprocessor = self._get_prepare_pp_for_dict(preprocessor)
-		elif isinstance(preprocessor, (tuple, list)):
-			preprocessor = self._get_prepare_pp_for_list(preprocessor)
+		if isinstance(preprocessor, (dict, tuple, list)):
+			from simputils.config.components.preprocessors import PreprocessorPipeline
+
+			preprocessor = PreprocessorPipeline(preprocessor)
 		elif not callable(preprocessor):
-			preprocessor = self._get_prepare_pp_for_non_callable()
+			preprocessor = identity_pp
 
 		return preprocessor
 
-	def _get_prepare_filter_wrapper(self, filter, preprocessor):
+	def _get_prepare_filter_wrapper(self, filter_keys: set, filter_matcher: Callable | None, preprocessor):
 		def _wrapper(key: str, val: Any):
+			if not filter_keys and filter_matcher is None:
+				return True
 			key, _ = preprocessor(key, val)
-			if not filter:
+			if key in filter_keys:
 				return True
-			for filter_key in filter:
-				filter_key, _ = preprocessor(filter_key, None)
-				if filter_key == key:
-					return True
-			return False
+			return filter_matcher is not None and isinstance(key, str) and filter_matcher(key) is not None
 		return _wrapper
 
+	def _compile_filter_keys(self, filter: Iterable, preprocessor: Callable) -> tuple[set, Callable | None]:
+		"""
+		Splits filter into a set of preprocessed keys and a single matcher compiled from all the glob patterns
+
+		Glob patterns are marked by "glob:" prefix (like "glob:APP_*"), they are not preprocessed,
+		and matched against already preprocessed string keys
+
+		:param filter:
+		:param preprocessor:
+		:return:
+		"""
+		filter_keys = set()
+		patterns = []
+		for filter_key in filter:
+			if isinstance(filter_key, str) and filter_key.startswith(_FILTER_GLOB_PREFIX):
+				patterns.append(fnmatch.translate(filter_key[len(_FILTER_GLOB_PREFIX):]))
+			else:
+				filter_key, _ = preprocessor(filter_key, None)
+				filter_keys.add(filter_key)
+
+		filter_matcher = re.compile("|".join(patterns)).match if patterns else None
+		return filter_keys, filter_matcher
+
 	# noinspection PyShadowingBuiltins
 	def _prepare_filter(self, filter: FilterType, preprocessor: Callable):
-		_filter = filter
-		if isinstance(filter, Iterable) or filter is True:
-
-			# NOTE  In case if filter is set to True
-			_filter = self._initial_preprocessed_keys if _filter is True else _filter
+		if filter is True:
+			# NOTE  Initial keys are being filled up on the first apply, so the same set is referenced
+			filter = self._get_prepare_filter_wrapper(self._initial_preprocessed_keys, None, preprocessor)
 
-			filter = self._get_prepare_filter_wrapper(_filter, preprocessor)
+		elif isinstance(filter, Iterable):
+			filter = self._get_prepare_filter_wrapper(*self._compile_filter_keys(filter, preprocessor), preprocessor)
 
 		elif not callable(filter):
-			def _wrapper(key: str, val: Any):
-				return True
-			filter = _wrapper
+			filter = accept_all_filter
 
 		return filter
 
@@ -324,14 +359,15 @@ class BasicConfigStore(dict, metaclass=ABCMeta):
 			filter,
 			none_considered_empty
 		)
-		for key, val in storage_result.items():
-			self._storage[key] = val
+		self._storage.update(storage_result)
 
-		# MARK	Can be optimized with help of `applied_keys`
 		if not self._initial_preprocessed_keys and config is not None:
-			for key in dict(config).keys():
-				key, _ = preprocessor(key, None)
-				self._initial_preprocessed_keys.append(key)
+			if preprocessor is identity_pp:
+				self._initial_preprocessed_keys.update(dict(config).keys())
+			else:
+				for key in dict(config).keys():
+					key, _ = preprocessor(key, None)
+					self._initial_preprocessed_keys.add(key)
 
 		return applied_keys
 
@@ -371,58 +407,233 @@ class BasicConfigStore(dict, metaclass=ABCMeta):
 			self._op_class = config
 
 		if config and inspect.isclass(config) and issubclass(config, Enum) and issubclass(config, str):
-			config = get_enum_defaults(self._op_class)
+			config = self._get_enum_defaults()
 
 		if self._op_class and issubclass(self._op_class, Enum) and issubclass(self._op_class, str):
 			config = self._process_str_enum(config)
 
 		applied_keys = self._apply_data(config, self._preprocessor, self._filter, none_considered_empty)
 
-		self._applied_confs.append(
+		self._append_history(
 			applied_conf_class(
 				applied_keys=applied_keys,
 				type=type,
 				name=name,
 				source=source,
-				ref=config,
+				ref=config if self._history_keep_refs else None,
 				handler=handler,
 			)
 		)
+
 		return self
 
+	def config_apply_stream(
+		self,
+		items: Iterable[tuple[Any, Any]],
+		name: str = None,
+		source: SourceType = None,
+		type: str = None,
+		handler: HandlerType = None,
+		none_considered_empty: bool = False,
+	):
+		"""
+		Applies key/value pairs one by one as they come from `items`, without materializing the whole config
+
+		Useful for streaming of big files (see `streaming` of file-handlers).
+		The history record does not keep `ref` to the applied data.
+		If `items` fails part-way, the already applied items are kept and recorded in the history
+
+		:param items: Iterable of (key, value) pairs
+		:param name:
+		:param source:
+		:param type:
+		:param handler:
+		:param none_considered_empty:
+		:return:
+		"""
+		_, name, source, type, handler = self._prepare_supported_types(None, name, source, type, handler)
+
+		is_str_enum = bool(self._op_class and issubclass(self._op_class, Enum) and issubclass(self._op_class, str))
+		initial_keys = None if self._initial_preprocessed_keys else set()
+
+		applied_keys = []
+		try:
+			for key, val in items:
+				config = {key: val}
+				if is_str_enum:
+					config = self._process_str_enum(config)
+				applied_keys.extend(self._apply_stream_item(config, none_considered_empty, initial_keys))
+		finally:
+			# NOTE  Items applied before a failure (like a truncated file) stay in the storage,
+			#       so they are recorded in history and provenance as well
+			if initial_keys:
+				# NOTE  Filled up at the end, otherwise `filter=True` would reject the rest of the keys
+				self._initial_preprocessed_keys.update(initial_keys)
+
+			self._append_history(
+				self._applied_conf_class(
+					applied_keys=applied_keys,
+					type=type,
+					name=name,
+					source=source,
+					ref=None,
+					handler=handler,
+				)
+			)
+
+		return self
+
+	def _apply_stream_item(self, config: dict, none_considered_empty: bool, initial_keys: set | None):
+		storage_result, applied_keys = self._strategy.apply_data(
+			self,
+			config,
+			self._preprocessor,
+			self._filter,
+			none_considered_empty
+		)
+		self._storage.update(storage_result)
+
+		if initial_keys is not None:
+			for key in config:
+				key, _ = self._preprocessor(key, None)
+				initial_keys.add(key)
+
+		return applied_keys
+
+	def _append_history(self, record: BasicAppliedConf):
+		"""
+		Adds history record according to the history retention settings
+
+		:param record:
+		:return:
+		"""
+		if self._collapse_single_value(record):
+			return
+
+		applied_confs = self._applied_confs
+		limit = self._history_limit
+		if limit == 0:
+			return
+
+		# NOTE  The oldest record is dropped by the deque itself, only the provenance index is cleaned up here
+		if limit is not None and len(applied_confs) == limit:
+			self._drop_provenance(applied_confs[0])
+
+		applied_confs.append(record)
+		self._provenance_index.update(dict.fromkeys(record.applied_keys, record))
+
+	def _drop_provenance(self, dropped: BasicAppliedConf):
+		for key in dropped.applied_keys:
+			if self._provenance_index.get(key) is dropped:
+				del self._provenance_index[key]
+
+	def _collapse_single_value(self, record: BasicAppliedConf) -> bool:
+		"""
+		Merges single-value record into the previous one if it's single-value record as well
+
+		The call-site (name and source) of the latest record is kept.
+		The previous record is never modified, it is replaced by a new merged record owned by the store,
+		which is then extended in place by the following single-value records of the same run
+		(until a new record is appended or `freeze()` is called)
+
+		:param record:
+		:return: True if record was collapsed
+		"""
+		applied_confs = self._applied_confs
+		if not self._history_collapse_single_values or not applied_confs or \
+			record.type != ConfigStoreType.SINGLE_VALUE or applied_confs[-1].type != ConfigStoreType.SINGLE_VALUE:
+			return False
+
+		merged = applied_confs[-1]
+		if merged is not self._collapse_record:
+			merged = self._start_collapse_record(merged)
+
+		collapse_keys = self._collapse_keys
+		new_keys = [key for key in dict.fromkeys(record.applied_keys) if key not in collapse_keys]
+		collapse_keys.update(new_keys)
+		merged.applied_keys.extend(new_keys)
+		if merged.ref is not None and record.ref is not None:
+			merged.ref.update(record.ref)
+		merged.name = record.name
+		merged.source = record.source
+		self._provenance_index.update(dict.fromkeys(record.applied_keys, merged))
+
+		return True
+
+	def _start_collapse_record(self, last: BasicAppliedConf) -> BasicAppliedConf:
+		"""
+		Replaces the last history record with its copy, that could be safely extended in place
+
+		:param last:
+		:return:
+		"""
+		merged = self._applied_conf_class(
+			applied_keys=list(last.applied_keys),
+			type=last.type,
+			name=last.name,
+			source=last.source,
+			handler=last.handler,
+			# NOTE  Refs might be supplied by the caller, so they are never modified
+			ref=dict(last.ref) if last.ref is not None else None,
+		)
+		self._applied_confs[-1] = merged
+
+		provenance_index = self._provenance_index
+		for key in last.applied_keys:
+			if provenance_index.get(key) is last:
+				provenance_index[key] = merged
+
+		self._collapse_record = merged
+		self._collapse_keys = set(merged.applied_keys)
+
+		return merged
+
+	def _get_enum_defaults(self) -> dict:
+		if issubclass(self._op_class, BasicConfigEnum):
+			return self._op_class.defaults()
+		return get_enum_defaults(self._op_class)  # pragma: no cover
+
+	def _get_enum_coercion_plan(self) -> dict:
+		pydantic_base_model_class = self._pydantic_setup()
+		if issubclass(self._op_class, BasicConfigEnum):
+			return self._op_class.get_coercion_plan(pydantic_base_model_class)
+		return get_enum_coercion_plan(self._op_class, pydantic_base_model_class)  # pragma: no cover
+
 	def _process_str_enum(self, config):
-		annotations = get_enum_all_annotations(self._op_class)
-		for key, val in config.items():
-			if key not in annotations:
-				continue
-			annotated_data = annotations[key].data
+		plan = self._get_enum_coercion_plan()
+		if not plan:
+			return config
 
-			if annotated_data and "type" in annotated_data and annotated_data["type"]:
-				like_union = get_args(annotated_data["type"])
-				if not like_union:
-					like_union = (annotated_data["type"],)
+		if len(plan) < len(config):
+			keys = [key for key in plan if key in config]
+		else:
+			keys = [key for key in config if key in plan]
 
-				self._process_union_subtypes(config, like_union, key, val)
+		errors = self._coerce_values(config, plan, keys)
+		if errors:
+			raise CoercionFailed(errors) from next(iter(errors.values()))
 
 		return config
 
-	def _process_union_subtypes(self, config, like_union, key, val):
-		pydantic_base_model_class = self._pydantic_base_model_class
-		for subtype in like_union:
-			if val is None:
-				config[key] = val
-				break
-			elif callable(subtype):
-				# noinspection PyTypeChecker
-				if pydantic_base_model_class and issubclass(subtype, pydantic_base_model_class):
-					# noinspection PyTypeChecker
-					if isinstance(val, subtype):
-						config[key] = val
-					else:
-						config[key] = subtype(**val)
-				else:
-					config[key] = subtype(val)
-				break
+	@classmethod
+	def _coerce_values(cls, config, plan: dict, keys: list) -> dict:
+		"""
+		Coerces values of `config` in place, errors are collected instead of being raised one by one
+
+		:param config:
+		:param plan:
+		:param keys:
+		:return: key -> exception
+		"""
+		errors = {}
+		for key in keys:
+			val = config[key]
+			if val is not None:
+				try:
+					config[key] = plan[key](val)
+				except (ValueError, TypeError) as e:
+					errors[key] = e
+		return errors
 
 	def applied_from(self, key: str, include_unprocessed_keys: bool = False) -> dict | None:
 		"""
@@ -432,13 +643,62 @@ class BasicConfigStore(dict, metaclass=ABCMeta):
 		:param include_unprocessed_keys:
 		:return:
 		"""
-		for record in reversed(self._applied_confs):
-			if key in record.applied_keys:
-				return record
-			if include_unprocessed_keys and key in record.ref:  # pragma: no cover
+		if not include_unprocessed_keys:
+			return self._provenance_index.get(key)
+
+		for record in reversed(self._applied_confs):  # pragma: no cover
+			if key in record.applied_keys or (record.ref is not None and key in record.ref):
 				return record
 
-		return None
+		return None  # pragma: no cover
+
+	def provenance(self) -> dict[str, BasicAppliedConf]:
+		"""
+		Returns the latest `AppliedConf` for each key at once (like `applied_from()` for every key)
+
+		:return:
+		"""
+		return dict(self._provenance_index)
+
+	def _normalize_key(self, key):
+		"""
+		Preprocesses the key for reading/writing through the keys cache
+
+		:param key:
+		:return:
+		"""
+		return self._key_cache.normalize(key, self._preprocessor)
+
+	def freeze(self):
+		"""
+		Creates immutable read-optimized snapshot of the current state (`FrozenConfigStore`)
+
+		Snapshot is not affected by further modifications of this `ConfigStore`
+		(nested values are not copied though)
+
+		:return:
+		"""
+		raw_keys = set(self._key_cache.keys())
+		for record in self._applied_confs:
+			if isinstance(record.ref, Mapping):
+				raw_keys.update(record.ref.keys())
+
+		# NOTE  The records are shared with the snapshot, so the next collapse must not extend them in place
+		self._collapse_record = None
+		self._collapse_keys = None
+
+		return self.frozen_class()(
+			self._storage,
+			raw_keys=raw_keys,
+			preprocessor=self._preprocessor,
+			strict_keys=self._strict_keys,
+			return_default_on_none=self._return_default_on_none,
+			name=self._name,
+			source=self._source,
+			type=self._type,
+			handler=self._handler,
+			applied_confs=self._applied_confs,
+		)
 
 	def get(self, key: str, default: Any = None):
 		"""
@@ -448,8 +708,7 @@ class BasicConfigStore(dict, metaclass=ABCMeta):
 		:param default:
 		:return:
 		"""
-		preprocessor = self._preprocessor
-		key, _ = preprocessor(key, None)
+		key = self._normalize_key(key)
 
 		if self._strict_keys and key not in self._storage:
 			raise StrictKeysEnabled(
@@ -474,8 +733,7 @@ class BasicConfigStore(dict, metaclass=ABCMeta):
 	def update(self, __m, **kwargs):
 		if self._strict_keys:
 			for key in __m:
-				preprocessor = self._preprocessor
-				key, _ = preprocessor(key, None)
+				key = self._normalize_key(key)
 				if key not in self._storage:
 					raise StrictKeysEnabled(
 						f"Strict Keys mode enabled. Only initial set of keys allowed. Key \"{key}\" is unknown"
@@ -498,29 +756,44 @@ class BasicConfigStore(dict, metaclass=ABCMeta):
 		raise NotPermitted("Popping from ConfigStore is not permitted due to architecture")
 
 	def __setitem__(self, key, value):
-		preprocessor = self._preprocessor
-		key, _ = preprocessor(key, None)
+		key = self._normalize_key(key)
 
 		if self._strict_keys and key not in self._storage:
 			raise StrictKeysEnabled(
 				f"Strict Keys mode enabled. Only initial set of keys allowed. Key \"{key}\" is unknown"
 			)
 
-		frame_context = inspect.stack()[1][0]
-		frame_info = inspect.getframeinfo(frame_context)
+		name, source = self._get_call_site()
 
 		self.config_apply(
 			{key: value},
-			f"{frame_info.function}:{frame_info.lineno}",
-			frame_info.filename,
+			name,
+			source,
 			ConfigStoreType.SINGLE_VALUE
 		)
 
+	def _get_call_site(self, depth: int = 2) -> tuple[str | None, str | None]:
+		"""
+		Returns name ("function:line") and source (file name) of the caller for the history record
+
+		:param depth: Depth of the frame relatively to this method (2 is the caller of the caller)
+		:return:
+		"""
+		if self._provenance_mode == ProvenanceModesEnum.OFF:
+			return None, None
+
+		frame = sys._getframe(depth)
+		if self._provenance_mode == ProvenanceModesEnum.FULL:
+			frame_info = inspect.getframeinfo(frame)
+			return f"{frame_info.function}:{frame_info.lineno}", frame_info.filename
+
+		code = frame.f_code
+		return f"{code.co_name}:{frame.f_lineno}", code.co_filename
+
 	def __add__(self, other):  # pragma: no cover
 		if self._strict_keys:
 			for key in other:
-				preprocessor = self._preprocessor
-				key, _ = preprocessor(key, None)
+				key = self._normalize_key(key)
 				if key not in self._storage:
 					raise StrictKeysEnabled(
 						f"Strict Keys mode enabled. Only initial set of keys allowed. Key \"{key}\" is unknown"
@@ -537,8 +810,7 @@ class BasicConfigStore(dict, metaclass=ABCMeta):
 		del self._storage[key]
 
 	def __getitem__(self, key):
-		preprocessor = self._preprocessor
-		key, _ = preprocessor(key, None)
+		key = self._normalize_key(key)
 
 		if self._strict_keys and key not in self._storage:
 			raise StrictKeysEnabled(
@@ -1,7 +1,11 @@
+import mmap
+import os
 from abc import ABCMeta, abstractmethod
 from io import IOBase
 from os.path import exists, basename, realpath
+from typing import Any, Callable, Hashable, Iterator
 
+from simputils.config.components.caches import ParsedFilesCache
 from simputils.config.enums import ConfigStoreType
 from simputils.config.types import FileType
 
@@ -15,15 +19,56 @@ class BasicFileHandler(metaclass=ABCMeta):
 
 	CONFIG_TYPE: str = "abstract"
 
+	FILE_EXTENSIONS: tuple[str, ...] = ()
+	"""
+	File extensions handled by the handler (like `(".yml", ".yaml")`), used by `ConfigHub` to pick
+	the handler without probing. If empty, the handler is probed for any file
+	"""
+
+	parse_cache: ParsedFilesCache | None = None
+	"""
+	Process-wide cache of parsed files, disabled by default.
+	To enable: `BasicFileHandler.parse_cache = ParsedFilesCache()`
+	"""
+
+	mmap_threshold: int | None = 1024 * 1024
+	"""
+	Files of this size (in bytes) or bigger are parsed directly from `mmap` (without reading them into memory),
+	if the handler's parser accepts buffers (see `_is_buffer_parsing_supported()`). None disables it
+	"""
+
 	@abstractmethod
 	def process_file(self, file: FileType):  # pragma: no cover
 		pass
 
+	def parse_file(self, file: FileType):
+		"""
+		Parses the file into raw data with metadata (`ParsedFile`) without creating `ConfigStore`
+
+		Used by `ConfigHub` to apply the data directly to the target.
+		By default wraps the result of `process_file()`, so custom handlers don't have to implement it
+
+		:param file:
+		:return: `ParsedFile` or None if the file is not handled
+		"""
+		from simputils.config.models import ParsedFile
+
+		conf = self.process_file(file)
+		if conf is None:
+			return None
+		return ParsedFile.from_config_store(conf)
+
 	def supported_types(self) -> tuple:  # pragma: no cover
 		return (self.CONFIG_TYPE,)
 
-	def _prepare_conf(self, file: FileType):
-		from simputils.config.models import ConfigStore
+	def _prepare_parsed(self, file: FileType):
+		"""
+		Prepares `ParsedFile` with metadata of the file, but without data
+
+		:param file:
+		:return: `ParsedFile` or None if the file does not exist
+		"""
+		from simputils.config.models import ParsedFile
 
 		if isinstance(file, IOBase):
 			name = type(file).__name__
@@ -36,12 +81,112 @@ class BasicFileHandler(metaclass=ABCMeta):
 			source = realpath(file)
 			_type = self.CONFIG_TYPE
 
-		return ConfigStore(
+		return ParsedFile(
 			name=name,
 			source=source,
 			type=_type,
 			handler=self,
 		)
 
+	def _prepare_conf(self, file: FileType):  # pragma: no cover
+		parsed = self._prepare_parsed(file)
+		if parsed is None:
+			return None
+		return parsed.to_config_store()
+
+	# noinspection PyMethodMayBeStatic
+	def _config_from_parsed(self, parsed):
+		if parsed is None:
+			return None
+		return parsed.to_config_store()
+
+	def _parser_key(self) -> Hashable:
+		"""
+		Identifies parsing settings of the handler for `parse_cache`
+
+		Must be redefined if the handler has settings affecting parsing results
+		"""
+		return self.__class__
+
+	def _parse_path_bytes(self, file: FileType, parse: Callable[[bytes], Any]) -> Any:
+		"""
+		Reads bytes of the file (see `_read_bytes()`) and parses them through `parse` callable
+		(using `parse_cache` if enabled)
+
+		:param file: Path to the file
+		:param parse: Callable receiving bytes of the file and returning parsed data
+		:return:
+		"""
+		parse_cache = self.parse_cache
+		if parse_cache is None:
+			return self._parse_path_mapped(file, parse)
+
+		return parse_cache.get_or_parse(file, parse, self._parser_key(), read=self._read_bytes)
+
+	def _parse_path_mapped(self, file: FileType, parse: Callable[[bytes | memoryview], Any]) -> Any:
+		"""
+		Parses the file through `parse` callable, big files (see `mmap_threshold`) are passed
+		as `memoryview` of `mmap` if the parser accepts buffers, otherwise the file is read as bytes
+
+		:param file: Path to the file
+		:param parse: Callable receiving bytes (or a buffer) of the file and returning parsed data
+		:return:
+		"""
+		with open(file, "rb") as fd:
+			threshold = self.mmap_threshold
+			if threshold is None or os.fstat(fd.fileno()).st_size < max(threshold, 1) or \
+				not self._is_buffer_parsing_supported():
+				return parse(fd.read())
+
+			try:
+				mm = mmap.mmap(fd.fileno(), 0, access=mmap.ACCESS_READ)
+			except (OSError, ValueError):  # pragma: no cover
+				# NOTE  Not mappable files (special file-systems, pipes, etc.)
+				return parse(fd.read())
+
+			# NOTE  The view is released before the mapping is closed, parsed data never refers to the buffer
+			with mm, memoryview(mm) as view:
+				return parse(view)
+
+	# noinspection PyMethodMayBeStatic
+	def _is_buffer_parsing_supported(self) -> bool:
+		"""
+		Whether the parser of `_parse_bytes()` accepts any buffer (like `memoryview` of `mmap`), not only bytes
+
+		Must be redefined by the handlers able to parse buffers
+		"""
+		return False
+
+	# noinspection PyMethodMayBeStatic
+	def _read_bytes(self, file: FileType) -> bytes:
+		"""
+		Reads the whole file as bytes
+
+		:param file: Path to the file
+		:return:
+		"""
+		with open(file, "rb") as fd:
+			return fd.read()
+
+	# noinspection PyMethodMayBeStatic
+	def _stream_path(
+		self,
+		file: FileType,
+		stream_class: type,
+		encoding: str = "utf-8-sig",
+	) -> Iterator[tuple[Any, Any]]:
+		"""
+		Opens the file and yields (key, value) pairs of `stream_class` over it, the file is closed
+		when the iteration is done
+
+		:param file: Path to the file
+		:param stream_class: Class iterating over (key, value) pairs of a text file object
+		:param encoding: Encoding of the file (UTF-8 with optional BOM by default, like the files read as bytes,
+			so the results do not depend on the locale)
+		:return:
+		"""
+		with open(file, "r", encoding=encoding) as fd:
+			yield from stream_class(fd)
+
 	def __call__(self, file: FileType):
 		return self.process_file(file)
@@ -1,9 +1,12 @@
 from abc import ABCMeta, abstractmethod
 from typing import Callable
 
+from simputils.config.base import identity_pp, accept_all_filter
 from simputils.config.components.simpletons import NotExisting
 from simputils.config.types import ConfigType
 
+_NOT_EXISTING = NotExisting()
+
 
 class BasicMergingStrategy(metaclass=ABCMeta):
 
@@ -16,18 +19,39 @@ class BasicMergingStrategy(metaclass=ABCMeta):
         filter: Callable,
         none_considered_empty: bool = False
     ):
-        applied_keys = []
+        if not isinstance(config, dict):
+            config = dict(config)
+        # NOTE  Keys are already preprocessed, so the storage is read directly
+        storage = target._storage
+
+        if preprocessor is identity_pp and filter is accept_all_filter:
+            storage_result = self.apply_data_bulk(storage, config, none_considered_empty)
+            return storage_result, list(storage_result)
+
         storage_result = {}
-        for key, val_incoming in dict(config).items():
+        merge = self.merge
+        for key, val_incoming in config.items():
             key, val_incoming = preprocessor(key, val_incoming)
             if filter(key, val_incoming):
-                applied_keys.append(key)
-                val_target = NotExisting()
-                if key in target:
-                    val_target = target.get(key)
-                storage_result[key] = self.merge(key, val_target, val_incoming, none_considered_empty)
+                val_target = storage.get(key, _NOT_EXISTING)
+                storage_result[key] = merge(key, val_target, val_incoming, none_considered_empty)
+
+        return storage_result, list(storage_result)
+
+    def apply_data_bulk(self, storage: dict, config: dict, none_considered_empty: bool = False) -> dict:
+        """
+        Merges the whole incoming data at once, when there is nothing to preprocess and filter
 
-        return storage_result, applied_keys
+        :param storage: Current storage of the target
+        :param config: Incoming data
+        :param none_considered_empty:
+        :return: Resulting values to be stored (the incoming data itself might be returned, it must not be modified)
+        """
+        merge = self.merge
+        return {
+            key: merge(key, storage.get(key, _NOT_EXISTING), val_incoming, none_considered_empty)
+            for key, val_incoming in config.items()
+        }
 
     @abstractmethod
     def merge(self, key, val_target, val_incoming, none_considered_empty: bool = False):  # pragma: no cover
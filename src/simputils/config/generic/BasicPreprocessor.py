@@ -4,6 +4,12 @@ from typing import Any
 
 class BasicPreprocessor(metaclass=ABCMeta):
 
+	keys_only: bool = False
+	"""
+	Must be `True` only if the preprocessor never changes values, and the resulting key depends only on the
+	incoming key (such preprocessors are fused and memoized by `PreprocessorPipeline`)
+	"""
+
 	def run(self, k: str, v: Any, *args, **kwargs) -> tuple[str, Any]:  # pragma: no cover
 		pass
 
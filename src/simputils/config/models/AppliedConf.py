@@ -6,4 +6,4 @@ class AppliedConf(BasicAppliedConf):
 	ConfigStore's history record
 	"""
 
-	pass
+	__slots__ = ()
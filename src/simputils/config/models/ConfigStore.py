@@ -1,5 +1,5 @@
 from simputils.config.generic import BasicConfigStore
-from simputils.config.models import AppliedConf
+from simputils.config.models import AppliedConf, FrozenConfigStore
 
 
 class ConfigStore(BasicConfigStore):
@@ -10,3 +10,7 @@ class ConfigStore(BasicConfigStore):
 	@classmethod
 	def applied_conf_class(cls):  # pragma: no cover
 		return AppliedConf
+
+	@classmethod
+	def frozen_class(cls):  # pragma: no cover
+		return FrozenConfigStore
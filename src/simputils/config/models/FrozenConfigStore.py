@@ -0,0 +1,226 @@
+from typing import Any, Callable
+
+from simputils.config.components.prisms import ObjConfigStorePrism
+from simputils.config.exceptions import NotPermitted, StrictKeysEnabled
+from simputils.config.generic import BasicAppliedConf
+from simputils.config.types import SourceType, HandlerType
+
+_dict_getitem = dict.__getitem__
+
+
+def _as_is(k, v):
+	return k, v
+
+
+class FrozenConfigStore(dict):
+	"""
+	Immutable read-optimized snapshot of `ConfigStore`
+
+	Created through `ConfigStore.freeze()`. Values are stored already preprocessed and
+	every known raw key is pre-mapped to its preprocessed form, so reading does not
+	involve preprocessor, filter or strict-keys logic (except for never seen keys).
+
+	Object is hashable and can be shared between threads without locks.
+	Any attempt to modify it raises `NotPermitted`.
+	"""
+
+	__slots__ = (
+		"_aliases",
+		"_preprocessor",
+		"_strict_keys",
+		"_return_default_on_none",
+		"_name",
+		"_source",
+		"_type",
+		"_handler",
+		"_applied_confs",
+		"_provenance_index",
+		"_obj_prism",
+		"_hash",
+	)
+
+	@property
+	def obj(self) -> ObjConfigStorePrism:
+		"""
+		Returns Object Prism for FrozenConfigStore
+		"""
+		if self._obj_prism is None:
+			self._obj_prism = ObjConfigStorePrism(self)
+		return self._obj_prism
+
+	@property
+	def name(self) -> str | None:
+		return self._name
+
+	@property
+	def source(self) -> SourceType | None:
+		return self._source
+
+	@property
+	def type(self) -> str | None:
+		return self._type
+
+	@property
+	def handler(self) -> HandlerType | None:
+		return self._handler
+
+	@property
+	def applied_confs(self) -> tuple[BasicAppliedConf]:
+		return self._applied_confs
+
+	@property
+	def history(self) -> tuple[BasicAppliedConf]:
+		"""
+		Alias for `applied_confs`
+		"""
+		return self.applied_confs
+
+	@property
+	def return_default_on_none(self) -> bool:  # pragma: no cover
+		return self._return_default_on_none
+
+	def __init__(
+		self,
+		storage: dict,
+		raw_keys: Any = (),
+		preprocessor: Callable = _as_is,
+		strict_keys: bool = False,
+		return_default_on_none: bool = True,
+		name: str = None,
+		source: SourceType = None,
+		type: str = None,
+		handler: HandlerType = None,
+		applied_confs: tuple[BasicAppliedConf] = (),
+	):
+		super().__init__(storage)
+		self._preprocessor = preprocessor
+		self._strict_keys = strict_keys
+		self._return_default_on_none = return_default_on_none
+		self._name = name
+		self._source = source
+		self._type = type
+		self._handler = handler
+		self._applied_confs = tuple(applied_confs)
+		self._provenance_index = {}
+		for record in self._applied_confs:
+			self._provenance_index.update(dict.fromkeys(record.applied_keys, record))
+		self._obj_prism = None
+		self._hash = None
+		self._aliases = self._prepare_aliases(raw_keys)
+
+	def _prepare_aliases(self, raw_keys) -> dict:
+		aliases = {}
+		for raw_key in (*self.keys(), *raw_keys):
+			if raw_key in aliases:
+				continue
+			key = self._normalize_key(raw_key)
+			if dict.__contains__(self, key):
+				aliases[raw_key] = key
+		return aliases
+
+	def _normalize_key(self, key):
+		key, _ = self._preprocessor(key, None)
+		return key
+
+	def _get_unknown(self, key, default: Any = None):
+		key = self._normalize_key(key)
+
+		if self._strict_keys and not dict.__contains__(self, key):
+			raise StrictKeysEnabled(
+				f"Strict Keys mode enabled. Only initial set of keys allowed. Key \"{key}\" is unknown"
+			)
+
+		res = dict.get(self, key)
+		if self._return_default_on_none:
+			return default if res is None else res
+		return res if dict.__contains__(self, key) else default
+
+	def get(self, key: str, default: Any = None):
+		"""
+		Equivalent to `conf["my-key"]` but you can specify default if the key is not found
+
+		:param key:
+		:param default:
+		:return:
+		"""
+		try:
+			res = _dict_getitem(self, self._aliases[key])
+		except KeyError:
+			return self._get_unknown(key, default)
+
+		if res is None and self._return_default_on_none:
+			return default
+		return res
+
+	def __getitem__(self, key):
+		try:
+			return _dict_getitem(self, self._aliases[key])
+		except KeyError:
+			return self._get_unknown(key)
+
+	def freeze(self) -> "FrozenConfigStore":
+		return self
+
+	def copy(self):  # pragma: no cover
+		return dict(self)
+
+	def applied_from(self, key: str) -> BasicAppliedConf | None:
+		"""
+		Returns the latest `AppliedConf` which affected `key` value
+
+		:param key:
+		:return:
+		"""
+		return self._provenance_index.get(key)
+
+	def provenance(self) -> dict[str, BasicAppliedConf]:
+		"""
+		Returns the latest `AppliedConf` for each key at once
+
+		:return:
+		"""
+		return dict(self._provenance_index)
+
+	def __hash__(self):
+		if self._hash is None:
+			try:
+				self._hash = hash(frozenset(self.items()))
+			except TypeError:
+				# NOTE  Unhashable values, hash is consistent with equality anyway
+				self._hash = hash(frozenset(self.keys()))
+		return self._hash
+
+	def _not_permitted(self, *args, **kwargs):
+		raise NotPermitted("FrozenConfigStore is immutable, modifications are not permitted")
+
+	config_apply = _not_permitted
+	config_apply_stream = _not_permitted
+	update = _not_permitted
+	clear = _not_permitted
+	pop = _not_permitted
+	popitem = _not_permitted
+	setdefault = _not_permitted
+	__setitem__ = _not_permitted
+	__delitem__ = _not_permitted
+	__add__ = _not_permitted
+	__iadd__ = _not_permitted
+	__ior__ = _not_permitted
+	# NOTE  Used by `ObjConfigStorePrism` right before applying a single value
+	_get_call_site = _not_permitted
+
+	def __reduce__(self):  # pragma: no cover
+		return (
+			self.__class__,
+			(
+				dict(self),
+				tuple(self._aliases),
+				self._preprocessor,
+				self._strict_keys,
+				self._return_default_on_none,
+				self._name,
+				self._source,
+				self._type,
+				self._handler,
+				self._applied_confs,
+			),
+		)
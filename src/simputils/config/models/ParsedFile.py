@@ -0,0 +1,61 @@
+from dataclasses import dataclass
+from typing import Any
+
+from simputils.config.models import ConfigStore
+from simputils.config.types import SourceType, HandlerType
+
+
+@dataclass(slots=True)
+class ParsedFile:
+	"""
+	Raw result of parsing a file by a file-handler (parsed data and metadata of the file)
+
+	Allows to apply the parsed data directly to the target `ConfigStore` without intermediate one.
+	If `is_stream` is True, `data` is an iterable of top-level (key, value) pairs, which is consumed
+	only once while applying
+	"""
+
+	data: Any = None
+	name: str = None
+	source: SourceType = None
+	type: str = None
+	handler: HandlerType = None
+	is_stream: bool = False
+
+	@classmethod
+	def from_config_store(cls, conf: ConfigStore) -> "ParsedFile":
+		"""
+		Wraps `ConfigStore` returned by a file-handler that does not support `parse_file()`
+
+		:param conf:
+		:return:
+		"""
+		return cls(data=conf, name=conf.name, source=conf.source, type=conf.type, handler=conf.handler)
+
+	def apply_to(self, target: ConfigStore, name: str = None, source: SourceType = None, type: str = None):
+		"""
+		Applies the parsed data to the `target` (metadata of the file is used if not specified)
+
+		:param target:
+		:param name:
+		:param source:
+		:param type:
+		:return:
+		"""
+		name = self.name if name is None else name
+		source = self.source if source is None else source
+		type = self.type if type is None else type
+
+		if self.is_stream:
+			return target.config_apply_stream(self.data, name, source, type, self.handler)
+		return target.config_apply(self.data, name, source, type, self.handler)
+
+	def to_config_store(self) -> ConfigStore:
+		return self.apply_to(
+			ConfigStore(
+				name=self.name,
+				source=self.source,
+				type=self.type,
+				handler=self.handler,
+			)
+		)
@@ -1,3 +1,5 @@
 from .AnnotatedConfigData import AnnotatedConfigData
 from .AppliedConf import AppliedConf
+from .FrozenConfigStore import FrozenConfigStore
 from .ConfigStore import ConfigStore
+from .ParsedFile import ParsedFile
@@ -0,0 +1,59 @@
+import asyncio
+from io import StringIO
+
+import pytest
+
+from simputils.config.base import simputils_pp
+from simputils.config.components import ConfigHub
+from simputils.config.components.handlers import DotEnvFileHandler
+from simputils.config.enums import ConfigStoreType
+from simputils.config.exceptions import NoHandler
+from simputils.config.models import ConfigStore
+
+
+class TestAsyncConfigHub:
+
+	def test_aaggregate(self):
+		async def _conditional_config(target: ConfigStore):
+			await asyncio.sleep(0)
+			if target["PARAM_2"] == "two":
+				return "tests/data/config-3.json"
+
+		args = (
+			"tests/data/config-1.yml",
+			"tests/data/config-2.yml",
+			_conditional_config,
+			"tests/data/config-4.env",
+			"tests/data/missing-file.env",
+			{"PARAM_5": "DICT 5"},
+		)
+
+		sequential = ConfigHub.aggregate(
+			"tests/data/config-1.yml",
+			"tests/data/config-2.yml",
+			"tests/data/config-3.json",
+			*args[3:],
+			target=ConfigStore(preprocessor=simputils_pp),
+		)
+		conf = asyncio.run(ConfigHub.aaggregate(*args, target=ConfigStore(preprocessor=simputils_pp)))
+
+		assert dict(conf) == dict(sequential)
+		assert conf["PARAM_5"] == "DICT 5"
+		assert [(r.type, r.name) for r in conf.history] == [(r.type, r.name) for r in sequential.history]
+
+	def test_aconfig_from_file(self):
+		conf = asyncio.run(ConfigHub.aconfig_from_file(
+			StringIO("test=BEST\nguest=TOAST"),
+			handler=DotEnvFileHandler(),
+		))
+
+		assert conf["test"] == "BEST"
+		assert conf.applied_confs[0].type == ConfigStoreType.IO
+
+	def test_aaggregate_no_handler(self):
+		ConfigHub.skip_files_with_missing_handler = False
+		try:
+			with pytest.raises(NoHandler):
+				asyncio.run(ConfigHub.aaggregate({"test": "test"}, "test.text", target=ConfigStore()))
+		finally:
+			ConfigHub.skip_files_with_missing_handler = True
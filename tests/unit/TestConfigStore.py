@@ -1,7 +1,14 @@
+import json
 from collections import OrderedDict
+from io import StringIO
 
-from simputils.config.enums import ConfigStoreType
-from simputils.config.models import ConfigStore, AppliedConf
+import pytest
+
+from simputils.config.base import simputils_pp
+from simputils.config.components.streams import JsonItemsStream
+from simputils.config.enums import ConfigStoreType, ProvenanceModesEnum
+from simputils.config.exceptions import NotPermitted, StrictKeysEnabled
+from simputils.config.models import ConfigStore, AppliedConf, FrozenConfigStore
 
 
 class TestConfigStore:
@@ -159,3 +166,225 @@ class TestConfigStore:
 
 		assert conf3.applied_confs[0].type == ConfigStoreType.CONFIG_STORE
 		assert conf3.applied_confs[1].type == ConfigStoreType.CONFIG_STORE
+
+	def test_key_cache(self):
+		conf = ConfigStore(
+			{"my key 1": 1, "my key 2": 2},
+			preprocessor=simputils_pp,
+			key_cache_size=2,
+		)
+		key_cache = conf.key_cache
+
+		assert conf["my key 1"] == 1
+		assert conf.get("my key 1") == 1
+		assert conf.obj.MY_KEY_2 == 2
+		assert key_cache.info() == {"hits": 1, "misses": 2, "size": 2, "max_size": 2}
+
+		# NOTE  Least recently used key ("my key 1") is evicted
+		assert conf["MY_KEY_1"] == 1
+		assert len(key_cache) == 2
+		assert conf["my key 1"] == 1
+		assert key_cache.misses == 4
+
+		# NOTE  Changing preprocessor drops cached keys
+		conf._preprocessor = lambda k, v: (k, v)
+		assert conf["my key 1"] is None
+		assert len(key_cache) == 1
+
+	def test_key_cache_disabled(self):
+		conf = ConfigStore({"my key 1": 1}, preprocessor=simputils_pp, key_cache_size=0)
+
+		assert conf["my key 1"] == 1
+		assert conf["my key 1"] == 1
+		assert conf.key_cache.info() == {"hits": 0, "misses": 2, "size": 0, "max_size": 0}
+
+	def test_freeze(self):
+		conf = ConfigStore(
+			{"my key 1": 1, "my key 2": None},
+			preprocessor=simputils_pp,
+			name="my-conf",
+		)
+		conf["my key 3"] = [1, 2]
+		frozen = conf.freeze()
+
+		assert isinstance(frozen, FrozenConfigStore)
+		assert frozen == {"MY_KEY_1": 1, "MY_KEY_2": None, "MY_KEY_3": [1, 2]}
+		assert frozen.name == "my-conf"
+		assert len(frozen.history) == 2
+		assert frozen.freeze() is frozen
+
+		assert frozen["my key 1"] == 1
+		assert frozen["MY_KEY_1"] == 1
+		assert frozen["my-key-1"] == 1
+		assert frozen["unknown"] is None
+		assert frozen.get("my key 2", "default") == "default"
+		assert frozen.get("unknown", "default") == "default"
+		assert frozen.obj.my_key_3 == [1, 2]
+		assert frozen.applied_from("MY_KEY_3").type == ConfigStoreType.SINGLE_VALUE
+
+		assert hash(frozen) == hash(conf.freeze())
+		assert {frozen: True}[conf.freeze()]
+
+		conf["my key 1"] = 100
+		assert frozen["my key 1"] == 1
+
+		for modify in (
+			lambda: frozen.config_apply({"my key 1": 2}),
+			lambda: frozen.update({"my key 1": 2}),
+			lambda: frozen.__setitem__("my key 1", 2),
+			lambda: frozen.obj.__setitem__("my key 1", 2),
+			lambda: frozen.pop("MY_KEY_1"),
+		):
+			with pytest.raises(NotPermitted):
+				modify()
+
+	def test_freeze_strict_keys(self):
+		frozen = ConfigStore({"v1": 1, "v2": None}, strict_keys=True, return_default_on_none=False).freeze()
+
+		assert frozen.get("v2", "default") is None
+
+		with pytest.raises(StrictKeysEnabled):
+			frozen.get("v3")
+
+	@pytest.mark.parametrize("provenance_mode", [ProvenanceModesEnum.CHEAP, ProvenanceModesEnum.FULL])
+	def test_single_value_provenance(self, provenance_mode):
+		conf = ConfigStore(provenance_mode=provenance_mode)
+
+		conf["test"] = "test"
+		conf.obj.test = "test"
+
+		for record in conf.history:
+			function_name, line = record.name.split(":")
+			assert function_name == "test_single_value_provenance"
+			assert int(line) > 0
+			assert record.source == __file__
+
+	def test_single_value_provenance_off(self):
+		conf = ConfigStore(provenance_mode=ProvenanceModesEnum.OFF)
+
+		conf["test"] = "test"
+
+		assert conf.history[0].type == ConfigStoreType.SINGLE_VALUE
+		assert conf.history[0].name is None
+		assert conf.history[0].source is None
+
+	def test_filter_patterns(self):
+		conf = ConfigStore(
+			{
+				"app-name": "my app",
+				"app-port": 8080,
+				"db-host": "localhost",
+				"db-port": 5432,
+				"db-name": "db",
+				"home": "/home/user",
+			},
+			preprocessor=simputils_pp,
+			filter=["glob:APP_*", "db-host", "glob:DB_P?RT"],
+		)
+
+		assert dict(conf) == {"APP_NAME": "my app", "APP_PORT": 8080, "DB_HOST": "localhost", "DB_PORT": 5432}
+
+		conf = ConfigStore({1: "a", "APP_X": 1, "key[0]": 2, "KEY0": 3}, filter=["glob:APP_*", "key[0]"])
+		assert dict(conf) == {"APP_X": 1, "key[0]": 2}
+
+		conf = ConfigStore({"key[0]": 1, "KEY0": 2}, preprocessor=simputils_pp, filter=["key[0]"])
+		assert dict(conf) == {"KEY_0_": 1}
+
+	def test_filter_initial_keys(self):
+		conf = ConfigStore({"key-1": 1, "key-2": 2}, preprocessor=simputils_pp, filter=True)
+		conf.config_apply({"key 2": 22, "key 3": 33})
+
+		assert dict(conf) == {"KEY_1": 1, "KEY_2": 22}
+
+	def test_provenance(self):
+		conf = ConfigStore({"v1": 1, "v2": 2}, name="first")
+		conf.config_apply({"v2": 22, "v3": 33}, name="second")
+		conf["v1"] = 11
+
+		provenance = conf.provenance()
+
+		assert list(provenance) == ["v1", "v2", "v3"]
+		assert provenance["v1"].type == ConfigStoreType.SINGLE_VALUE
+		assert provenance["v2"].name == "second"
+		assert provenance["v3"] is conf.applied_from("v3")
+		assert conf.applied_from("v4") is None
+		assert conf.freeze().provenance() == provenance
+
+	def test_history_retention(self):
+		conf = ConfigStore(
+			{"v1": 1, "v2": 2},
+			history_limit=3,
+			history_keep_refs=False,
+			history_collapse_single_values=True,
+		)
+		for i in range(100):
+			conf["v3"] = i
+			conf["v4"] = i
+
+		assert len(conf.history) == 2
+		assert conf.history[1].applied_keys == ["v3", "v4"]
+		assert conf.history[1].ref is None
+		assert conf.applied_from("v4") is conf.history[1]
+		assert conf["v3"] == 99
+
+		conf.config_apply({"v2": 22})
+		conf.config_apply({"v5": 5})
+
+		assert len(conf.history) == 3
+		assert conf.applied_from("v1") is None
+		assert conf.applied_from("v2").applied_keys == ["v2"]
+		assert sorted(conf.provenance()) == ["v2", "v3", "v4", "v5"]
+		assert not hasattr(conf.history[0], "__dict__")
+
+	def test_history_collapse_keeps_refs(self):
+		conf = ConfigStore(history_collapse_single_values=True)
+		conf["v1"] = 1
+		conf["v1"] = 2
+		conf["v2"] = 3
+
+		assert len(conf.history) == 1
+		assert conf.history[0].ref == {"v1": 2, "v2": 3}
+
+		ref = {"v3": 4}
+		conf.config_apply(ref, type=ConfigStoreType.SINGLE_VALUE)
+		conf.config_apply({"v4": 5}, type=ConfigStoreType.SINGLE_VALUE)
+
+		assert ref == {"v3": 4}
+		assert conf.history[0].ref == {"v1": 2, "v2": 3, "v3": 4, "v4": 5}
+
+	def test_history_collapse_after_freeze(self):
+		conf = ConfigStore(history_collapse_single_values=True)
+		conf["v1"] = 1
+		conf["v2"] = 2
+		frozen = conf.freeze()
+		conf["v3"] = 3
+
+		assert len(frozen.history) == 1
+		assert frozen.history[0].applied_keys == ["v1", "v2"]
+		assert frozen.history[0].ref == {"v1": 1, "v2": 2}
+		assert frozen.applied_from("v3") is None
+		assert frozen.get("v3") is None
+
+		assert len(conf.history) == 1
+		assert conf.history[0].applied_keys == ["v1", "v2", "v3"]
+		assert conf.applied_from("v1") is conf.history[0]
+		assert conf.applied_from("v3") is conf.history[0]
+
+	def test_apply_stream_truncated(self):
+		conf = ConfigStore({"c": 0})
+
+		with pytest.raises(json.JSONDecodeError):
+			conf.config_apply_stream(JsonItemsStream(StringIO('{"a": 1, "b": [2, 3], "c": ')), name="truncated")
+
+		assert dict(conf) == {"a": 1, "b": [2, 3], "c": 0}
+		assert conf.applied_from("a").name == "truncated"
+		assert conf.applied_from("b").applied_keys == ["a", "b"]
+		assert conf.applied_from("c") is conf.history[0]
+
+	def test_history_limit_zero(self):
+		conf = ConfigStore({"v1": 1}, history_limit=0)
+		conf["v2"] = 2
+
+		assert len(conf.history) == 0
+		assert conf.provenance() == {}
+		assert conf["v2"] == 2
@@ -8,7 +8,7 @@ import pytest
 from simputils.config.base import simputils_pp, simputils_pp_with_cast
 from simputils.config.components import ConfigHub
 from simputils.config.enums import ConfigStoreType
-from simputils.config.exceptions import StrictKeysEnabled
+from simputils.config.exceptions import StrictKeysEnabled, CoercionFailed
 from simputils.config.generic import BasicConfigEnum
 from simputils.config.models import ConfigStore, AnnotatedConfigData
 
@@ -416,3 +416,73 @@ class TestConfigStoreThroughAggregate:
 
 		with pytest.raises(StrictKeysEnabled) as exc_i:
 			g = conf.get("test")
+
+	def test_enum_metadata_cached(self, monkeypatch):
+		class MyEnum(BasicConfigEnum):
+			MY_E_KEY_1 = "my-e-key-1"
+
+			MY_E_KEY_2: Annotated[str, AnnotatedConfigData(
+				default=3.1415,
+				type=float,
+			)] = "my-e-key-2"
+
+			MY_E_KEY_3: Annotated[str, AnnotatedConfigData(
+				type=int | None,
+			)] = "my-e-key-3"
+
+		defaults = MyEnum.defaults()
+		assert defaults == {"my-e-key-1": None, "my-e-key-2": 3.1415, "my-e-key-3": None}
+		defaults["my-e-key-1"] = "changed"
+		assert MyEnum.defaults()["my-e-key-1"] is None
+
+		assert MyEnum.get_casters() is MyEnum.get_casters()
+		assert MyEnum.get_casters() == {"my-e-key-2": (float,), "my-e-key-3": (int, type(None))}
+		assert MyEnum.get_annotation_for("my-e-key-2").data["default"] == 3.1415
+		assert MyEnum.get_annotation_for(MyEnum.MY_E_KEY_1) is None
+
+		# NOTE  The coercion plan is compiled from the cached casters, annotations are not extracted again
+		monkeypatch.setattr("simputils.config.base.get_enum_casters", None)
+		assert MyEnum.get_coercion_plan() == {"my-e-key-2": float, "my-e-key-3": int}
+		monkeypatch.undo()
+
+		conf = ConfigStore(MyEnum)
+		conf.config_apply({"my-e-key-2": "2.5", "my-e-key-3": "12", "other": "13"})
+
+		assert conf[MyEnum.MY_E_KEY_2] == 2.5
+		assert conf[MyEnum.MY_E_KEY_3] == 12
+		assert conf["other"] == "13"
+
+	def test_enum_coercion_errors_aggregated(self):
+		from pydantic import BaseModel
+
+		ConfigStore._set_pydantic_enabled(True)
+
+		class MyModel(BaseModel):
+			port: int = None
+
+		class MyEnum(BasicConfigEnum):
+			MY_E_KEY_1: Annotated[str, AnnotatedConfigData(
+				type=int,
+			)] = "my-e-key-1"
+
+			MY_E_KEY_2: Annotated[str, AnnotatedConfigData(
+				type=float,
+			)] = "my-e-key-2"
+
+			MY_E_KEY_3: Annotated[str, AnnotatedConfigData(
+				type=MyModel | None,
+			)] = "my-e-key-3"
+
+		conf = ConfigStore(MyEnum)
+		conf.config_apply({"my-e-key-1": "1", "my-e-key-3": {"port": "8080"}})
+
+		assert conf[MyEnum.MY_E_KEY_1] == 1
+		assert isinstance(conf[MyEnum.MY_E_KEY_3], MyModel) and conf[MyEnum.MY_E_KEY_3].port == 8080
+
+		with pytest.raises(CoercionFailed) as exc_i:
+			conf.config_apply({"my-e-key-1": "one", "my-e-key-2": "2.5", "my-e-key-3": {"port": "port"}})
+
+		assert set(exc_i.value.errors) == {"my-e-key-1", "my-e-key-3"}
+		assert isinstance(exc_i.value, ValueError) and isinstance(exc_i.value, TypeError)
+		assert conf[MyEnum.MY_E_KEY_1] == 1
+		assert MyEnum.get_coercion_plan(BaseModel) is MyEnum.get_coercion_plan(BaseModel)
@@ -1,12 +1,25 @@
+import json
 import os
 import re
+import sys
+from enum import Enum
 from io import StringIO, TextIOWrapper
 
+import pytest
+import yaml
+
+from fixtures import fixture_flat_strategy_default, fixture_recursive_strategy_list_merge, \
+	fixture_recursive_strategy_list_replace, fixture_recursive_strategy_objects
 from simputils.config.base import simputils_pp
-from simputils.config.components import ConfigHub
+from simputils.config.components import ConfigHub, FileHandlersIndex
+from simputils.config.components.caches import ParsedFilesCache
 from simputils.config.components.handlers import DotEnvFileHandler, YamlFileHandler, JsonFileHandler
-from simputils.config.enums import ConfigStoreType
-from simputils.config.models import ConfigStore, AppliedConf
+from simputils.config.components.parsers import DotEnvParser
+from simputils.config.components.streams import JsonItemsStream, YamlItemsStream
+from simputils.config.enums import ConfigStoreType, JsonBackendsEnum
+from simputils.config.exceptions import WrongFormat
+from simputils.config.generic import BasicFileHandler
+from simputils.config.models import ConfigStore, AppliedConf, ParsedFile
 
 
 class TestFileHandlers:
@@ -105,3 +118,429 @@ class TestFileHandlers:
 			assert ac_first.name == TextIOWrapper.__name__
 			assert isinstance(ac_first.source, TextIOWrapper)
 			assert isinstance(ac_first.handler, YamlFileHandler)
+
+	def test_files_load_parallel(self):
+		args = (
+			"tests/data/config-1.yml",
+			"tests/data/config-2.yml",
+			lambda target: "tests/data/config-3.json" if target["PARAM_2"] == "two" else None,
+			"tests/data/config-4.env",
+			"tests/data/missing-file.env",
+			{"PARAM_5": "DICT 5"},
+			"tests/data/config-3.json",
+		)
+
+		sequential = ConfigHub.aggregate(*args, target=ConfigStore(preprocessor=simputils_pp))
+		parallel = ConfigHub.aggregate(*args, target=ConfigStore(preprocessor=simputils_pp), parallel=2)
+
+		assert dict(parallel) == dict(sequential)
+		assert parallel["PARAM_5"] == "JSON 5"
+		assert [(r.type, r.name) for r in parallel.history] == [(r.type, r.name) for r in sequential.history]
+
+	def test_parse_cache(self, tmp_path):
+		parse_cache = ParsedFilesCache(max_size=2, content_hash=True)
+		BasicFileHandler.parse_cache = parse_cache
+		try:
+			file = tmp_path / "conf.json"
+			file.write_text('{"PARAM_1": {"sub": [1, 2]}}')
+
+			conf_1 = ConfigHub.config_from_file(str(file))
+			conf_1["PARAM_1"]["sub"].append(3)
+			conf_2 = ConfigHub.config_from_file(str(file))
+
+			assert conf_2["PARAM_1"] == {"sub": [1, 2]}
+			assert parse_cache.info() == {"hits": 1, "misses": 1, "size": 1, "max_size": 2}
+
+			file.write_text('{"PARAM_1": "changed"}')
+			assert ConfigHub.config_from_file(str(file))["PARAM_1"] == "changed"
+			assert parse_cache.misses == 2
+
+			ConfigHub.aggregate("tests/data/config-1.yml", "tests/data/config-4.env", target=ConfigStore())
+			assert len(parse_cache) == 2
+
+			parse_cache.invalidate("tests/data/config-4.env")
+			assert len(parse_cache) == 1
+			parse_cache.invalidate()
+			assert len(parse_cache) == 0
+		finally:
+			BasicFileHandler.parse_cache = None
+
+	def test_parse_cache_copy_data(self, tmp_path):
+		parse_cache = ParsedFilesCache()
+		BasicFileHandler.parse_cache = parse_cache
+		try:
+			file = tmp_path / "anchors.yml"
+			file.write_text("a: &x\n  k: [1, 2]\n  self: *x\nb: *x\n")
+
+			ConfigHub.config_from_file(str(file))
+			conf = ConfigHub.config_from_file(str(file))
+
+			assert parse_cache.hits == 1
+			assert conf["a"]["self"] is conf["a"]
+			assert conf["b"] is conf["a"]
+			conf["a"]["k"].append(3)
+			assert ConfigHub.config_from_file(str(file))["a"]["k"] == [1, 2]
+		finally:
+			BasicFileHandler.parse_cache = None
+
+		deep = current = []
+		for _ in range(10000):
+			current.append({"sub": []})
+			current = current[0]["sub"]
+		copied = ParsedFilesCache.copy_data(deep)
+		depth = 0
+		while copied:
+			assert copied is not deep
+			copied, deep = copied[0]["sub"], deep[0]["sub"]
+			depth += 1
+		assert depth == 10000
+
+	def test_handlers_dispatch(self):
+		calls = []
+
+		class CountingYamlFileHandler(YamlFileHandler):
+			def process_file(self, file):
+				calls.append(self.CONFIG_TYPE)
+				return super().process_file(file)
+
+		class CountingJsonFileHandler(JsonFileHandler):
+			def process_file(self, file):
+				calls.append(self.CONFIG_TYPE)
+				return super().process_file(file)
+
+		def custom_handler(file):
+			calls.append("custom")
+			return None
+
+		index = FileHandlersIndex([custom_handler, CountingJsonFileHandler(), CountingYamlFileHandler()])
+
+		assert index.get_handlers("tests/data/config-1.yml") == (custom_handler, index._handlers[2])
+		assert index.get_handlers("tests/data/config.unknown") == (custom_handler, )
+
+		orig_file_handlers = ConfigHub.file_handlers
+		ConfigHub.file_handlers = [CountingJsonFileHandler(), CountingYamlFileHandler(), DotEnvFileHandler()]
+		try:
+			conf = ConfigHub.aggregate("tests/data/config-1.yml", "tests/data/config-3.json", target=ConfigStore())
+			assert conf["param-1"] == "first parameter"
+			assert calls == [ConfigStoreType.YAML, ConfigStoreType.JSON]
+
+			calls.clear()
+			conf = ConfigHub.config_from_file(StringIO("TEST1: test1"), type=ConfigStoreType.YAML)
+			assert conf["TEST1"] == "test1"
+			assert calls == [ConfigStoreType.YAML]
+		finally:
+			ConfigHub.file_handlers = orig_file_handlers
+
+	def test_handlers_dispatch_fallback(self):
+		# NOTE  Handlers listed after the declaring one are still tried if it returns None
+		calls = []
+
+		class RefusingJsonFileHandler(JsonFileHandler):
+			def parse_file(self, file):
+				calls.append("refused")
+				return None
+
+		def fallback_handler(file):
+			calls.append("fallback")
+			return ConfigStore({"fallback": file})
+
+		handlers = [RefusingJsonFileHandler(), YamlFileHandler(), fallback_handler]
+		index = FileHandlersIndex(handlers)
+		assert index.get_handlers("tests/data/config-3.json") == (handlers[0], fallback_handler)
+
+		orig_file_handlers = ConfigHub.file_handlers
+		ConfigHub.file_handlers = handlers
+		try:
+			conf = ConfigHub.config_from_file("tests/data/config-3.json")
+			assert conf["fallback"] == "tests/data/config-3.json"
+			assert calls == ["refused", "fallback"]
+		finally:
+			ConfigHub.file_handlers = orig_file_handlers
+
+	def test_parsed_file_applied_directly(self):
+		handler = JsonFileHandler()
+		parsed = handler.parse_file("tests/data/config-3.json")
+		assert isinstance(parsed, ParsedFile)
+		assert parsed.type == ConfigStoreType.JSON
+		assert parsed.handler is handler
+
+		conf = ConfigHub.config_from_file("tests/data/config-3.json", name="my-json")
+		assert conf.name == "my-json"
+		assert len(conf.applied_confs) == 1
+		assert isinstance(conf.applied_confs[0].ref, dict)
+		assert isinstance(conf.applied_confs[0].handler, JsonFileHandler)
+
+		target = ConfigStore()
+		ConfigHub.config_from_file("tests/data/config-1.yml", target=target)
+		assert len(target.applied_confs) == 1
+		assert target.applied_confs[0].type == ConfigStoreType.YAML
+
+		assert handler.process_file("tests/data/config-3.json") == conf
+
+	def test_handler_with_custom_process_file(self):
+		class ExtraJsonFileHandler(JsonFileHandler):
+			def process_file(self, file):
+				conf = super().process_file(file)
+				conf["extra"] = "extra value"
+				return conf
+
+		conf = ConfigHub.config_from_file("tests/data/config-3.json", handler=ExtraJsonFileHandler())
+		assert conf["extra"] == "extra value"
+
+		conf = ConfigHub.aggregate("tests/data/config-3.json", target=ConfigStore())
+		assert "extra" not in conf
+
+	def test_custom_callable_handler(self):
+		def custom_handler(file):
+			return ConfigStore({"custom": file}, name="custom-name")
+
+		conf = ConfigHub.config_from_file("tests/data/config-3.json", handler=custom_handler)
+		assert conf["custom"] == "tests/data/config-3.json"
+		assert conf.name == "custom-name"
+
+	def test_streaming(self):
+		files = ("tests/data/config-1.yml", "tests/data/config-2.yml", "tests/data/config-3.json")
+
+		expected = ConfigHub.aggregate(*files, target=ConfigStore(preprocessor=simputils_pp))
+
+		orig_file_handlers = ConfigHub.file_handlers
+		ConfigHub.file_handlers = [
+			JsonFileHandler(streaming=True),
+			YamlFileHandler(streaming=True),
+			DotEnvFileHandler(),
+		]
+		try:
+			conf = ConfigHub.aggregate(*files, target=ConfigStore(preprocessor=simputils_pp))
+			assert dict(conf) == dict(expected)
+			assert conf.applied_confs[0].ref is None
+			assert conf.applied_confs[0].applied_keys == expected.applied_confs[0].applied_keys
+			assert conf.applied_from("PARAM_4").type == ConfigStoreType.JSON
+
+			conf = ConfigHub.config_from_file(StringIO("TEST1: test1\nTEST2: [1, 2]"), type=ConfigStoreType.YAML)
+			assert dict(conf) == {"TEST1": "test1", "TEST2": [1, 2]}
+
+			conf = ConfigHub.aggregate({"PARAM_4": "default"}, "tests/data/config-3.json", target=ConfigStore(
+				preprocessor=simputils_pp,
+				filter=True,
+			))
+			assert dict(conf) == {"PARAM_4": "JSON 4"}
+		finally:
+			ConfigHub.file_handlers = orig_file_handlers
+
+	@pytest.mark.parametrize("handler_class", (JsonFileHandler, YamlFileHandler))
+	def test_streaming_encoding(self, tmp_path, monkeypatch, handler_class):
+		# NOTE  Locale's encoding must not affect streaming (non-streaming mode always parses UTF-8),
+		#       non-UTF-8 locale is simulated for the files opened without explicit encoding
+		def _open(file, mode="r", *args, encoding=None, **kwargs):
+			if "b" not in mode and encoding is None:
+				encoding = "latin-1"
+			return open(file, mode, *args, encoding=encoding, **kwargs)
+
+		monkeypatch.setattr(sys.modules[BasicFileHandler.__module__], "open", _open, raising=False)
+
+		content = json.dumps({"name": "Zoë ü €", "list": ["ß"]}, ensure_ascii=False).encode()
+		for i, data in enumerate((content, b"\xef\xbb\xbf" + content)):
+			file = tmp_path / f"config-{i}{handler_class.FILE_EXTENSIONS[0]}"
+			file.write_bytes(data)
+
+			expected = handler_class().parse_file(str(file)).data
+			assert expected == {"name": "Zoë ü €", "list": ["ß"]}
+			assert dict(handler_class(streaming=True).parse_file(str(file)).data) == expected
+
+	@pytest.mark.parametrize("chunk_size", (1, 2, 5, 65536))
+	def test_json_items_stream(self, chunk_size):
+		data = {"a": 1, "b": [1, 2, {"c": "d , }"}], "e": 12345678901, "f": None, "g": 1.5e10, "h": "\"q\""}
+
+		assert list(JsonItemsStream(StringIO(json.dumps(data)), chunk_size)) == list(data.items())
+		assert list(JsonItemsStream(StringIO(" { } "), chunk_size)) == []
+
+		for wrong in ("[1]", '{"a": 1', '{"a": 1} x', '{"a" 1}', '{"a": 1; "b": 2}'):
+			with pytest.raises(WrongFormat):
+				list(JsonItemsStream(StringIO(wrong), chunk_size))
+
+	def test_yaml_items_stream(self):
+		stream = YamlItemsStream(StringIO("a: &x {k: 1}\nb: *x\nc: [1, 2]\nd: ~\n"))
+		assert list(stream) == [("a", {"k": 1}), ("b", {"k": 1}), ("c", [1, 2]), ("d", None)]
+
+		assert list(YamlItemsStream(StringIO(""))) == []
+		assert list(YamlItemsStream(StringIO("---\n~\n"))) == []
+
+		with pytest.raises(WrongFormat):
+			list(YamlItemsStream(StringIO("- 1\n- 2\n")))
+
+		for content in ("a: 1\n---\nb: 2\n", "---\n~\n---\nb: 2\n", "a: 1\n--- 5\n"):
+			with pytest.raises(yaml.composer.ComposerError, match="expected a single document"):
+				yaml.safe_load(content)
+			with pytest.raises(yaml.composer.ComposerError, match="expected a single document"):
+				list(YamlItemsStream(StringIO(content)))
+		assert list(YamlItemsStream(StringIO("---\na: 1\n...\n"))) == [("a", 1)]
+
+	def test_read_bytes(self, tmp_path):
+		json_handler = JsonFileHandler()
+		env_handler = DotEnvFileHandler()
+
+		json_file = tmp_path / "big.json"
+		json_file.write_text(json.dumps({f"PARAM_{i}": f"value {i} ü" for i in range(1000)}), encoding="utf-8")
+		empty_file = tmp_path / "empty.env"
+		empty_file.write_bytes(b"")
+
+		assert json_handler._read_bytes(str(json_file)) == json_file.read_bytes()
+		assert env_handler._read_bytes(str(empty_file)) == b""
+
+		conf = json_handler.process_file(str(json_file))
+		assert conf["PARAM_999"] == "value 999 ü"
+
+		conf = env_handler.process_file("tests/data/config-4.env")
+		assert dict(conf) == dict(DotEnvFileHandler().process_file(StringIO(open("tests/data/config-4.env").read())))
+
+		BasicFileHandler.parse_cache = parse_cache = ParsedFilesCache()
+		try:
+			assert json_handler.process_file(str(json_file))["PARAM_1"] == "value 1 ü"
+			assert json_handler.process_file(str(json_file))["PARAM_1"] == "value 1 ü"
+			assert parse_cache.info()["hits"] == 1
+		finally:
+			BasicFileHandler.parse_cache = None
+
+	def test_mmap_parse(self, tmp_path):
+		pytest.importorskip("orjson")
+
+		received = []
+		handler = JsonFileHandler(backend=JsonBackendsEnum.ORJSON)
+		decoder = handler._get_decoder()
+		handler._decoder = lambda data: received.append(type(data)) or decoder(data)
+
+		small_file = tmp_path / "small.json"
+		small_file.write_bytes(b'{"a": 1}')
+		big_file = tmp_path / "big.json"
+		big_file.write_text(json.dumps({f"PARAM_{i}": i for i in range(100000)}))
+		assert big_file.stat().st_size >= handler.mmap_threshold
+
+		assert handler.parse_file(str(small_file)).data == {"a": 1}
+		assert handler.parse_file(str(big_file)).data["PARAM_99999"] == 99999
+		assert received == [bytes, memoryview]
+
+		# NOTE  Parsers not accepting buffers always receive bytes
+		env_file = tmp_path / "big.env"
+		env_file.write_text("".join(f"PARAM_{i}=value {i}\n" for i in range(100000)))
+		assert DotEnvFileHandler(native=True).parse_file(str(env_file)).data["PARAM_99999"] == "value 99999"
+
+	@pytest.mark.parametrize("interpolate", (True, False))
+	@pytest.mark.parametrize("content", (
+		"A=1\nexport B = two words  \n",
+		"A='single # q'\nB=\"dbl \\n esc \\\" q\"\nC=raw # comment\nD=raw#value\n",
+		"# comment\n\n   # another\nA\nB=\nC= # comment\n",
+		"A='multi\nline'\nB=\"multi\nline\"\n'quoted key'=v\r\nC=3\r",
+		"A=${TEST_DOTENV_HOME}/p\nB=${A}/q\nC=${MISSING:-def}\nD='${A}'\nE=\"${A}\"\nF=${MISSING}",
+		"A='unterminated\nB=2\nC='x' trailing\nD=\"it's\"\nA=again",
+	))
+	def test_dotenv_native_parser(self, monkeypatch, content, interpolate):
+		monkeypatch.setenv("TEST_DOTENV_HOME", "/home/test")
+
+		expected = DotEnvFileHandler(interpolate=interpolate).parse_file(StringIO(content)).data
+		parsed = DotEnvFileHandler(native=True, interpolate=interpolate).parse_file(StringIO(content))
+
+		assert parsed.data == dict(expected)
+		assert DotEnvParser(interpolate).parse(content) == dict(expected)
+
+	def test_dotenv_native_handler(self):
+		conf = ConfigHub.config_from_file("tests/data/config-4.env", handler=DotEnvFileHandler(native=True))
+		assert dict(conf) == {"param-4": "ENV PARAM 4"}
+
+	@pytest.mark.parametrize("mmap_threshold", (None, 1))
+	@pytest.mark.parametrize("backend", (
+		JsonBackendsEnum.AUTO,
+		JsonBackendsEnum.STDLIB,
+		JsonBackendsEnum.ORJSON,
+		json.loads,
+	))
+	def test_json_backends(self, tmp_path, backend, mmap_threshold):
+		if backend == JsonBackendsEnum.ORJSON:
+			pytest.importorskip("orjson")
+
+		handler = JsonFileHandler(backend=backend)
+		handler.mmap_threshold = mmap_threshold
+		contents = (
+			b'{"a": 1, "a": 2, "b": [1, 2.5e3, -0.0, "x\\u00e9"], "c": {"d": null, "e": true}}',
+			b'\xef\xbb\xbf{"a": 1}',
+			b'{"a": "\\ud800", "b": NaN, "c": Infinity, "d": 1e400}',
+			b'{"a": 123456789012345678901234567890, "b": 18446744073709551615, "c": -9223372036854775808}',
+			b'{"a": -9223372036854775809, "b": -18446744073709551616}',
+		)
+		for i, content in enumerate(contents):
+			file = tmp_path / f"config-{i}.json"
+			file.write_bytes(content)
+			parsed = handler.parse_file(str(file))
+			assert repr(parsed.data) == repr(json.loads(content))
+
+		assert handler.parse_file(StringIO('{"a": [1]}')).data == {"a": [1]}
+
+		# NOTE  Long number on the border of the chunks checked for long numbers
+		file = tmp_path / "border.json"
+		file.write_bytes(b'{"a": "' + b"x" * (1024 * 1024 - 17) + b'", "b": -9223372036854775809}')
+		assert handler.parse_file(str(file)).data["b"] == -9223372036854775809
+
+		file = tmp_path / "wrong.json"
+		file.write_bytes(b'[1, 2]')
+		with pytest.raises(WrongFormat):
+			handler.parse_file(str(file))
+
+		file.write_bytes(b'{"a": ')
+		with pytest.raises(json.JSONDecodeError):
+			handler.parse_file(str(file))
+
+	@pytest.mark.parametrize("fixture", (
+		fixture_flat_strategy_default,
+		fixture_recursive_strategy_list_merge,
+		fixture_recursive_strategy_list_replace,
+		fixture_recursive_strategy_objects,
+	))
+	def test_yaml_libyaml_equivalence(self, fixture):
+		pure_handler, c_handler = _get_yaml_handlers_pair()
+
+		documents = []
+		for expected, args in fixture.data:
+			documents.append(expected)
+			documents.extend(args)
+
+		for document in documents:
+			content = yaml.safe_dump(_to_plain(document))
+			expected = yaml.safe_load(content)
+			assert pure_handler.parse_file(StringIO(content)).data == expected
+			assert c_handler.parse_file(StringIO(content)).data == expected
+
+	def test_yaml_libyaml_files(self):
+		pure_handler, c_handler = _get_yaml_handlers_pair()
+
+		for file in ("tests/data/config-1.yml", "tests/data/config-2.yml", "tests/data/pydantic-check.yml"):
+			assert c_handler.parse_file(file).data == pure_handler.parse_file(file).data
+
+		with pytest.raises(yaml.constructor.ConstructorError):
+			c_handler.parse_file(StringIO("a: !!python/object/apply:os.getcwd []"))
+
+
+def _get_yaml_handlers_pair() -> tuple[YamlFileHandler, YamlFileHandler]:
+	"""
+	Returns pure python and libyaml based YAML file handlers (skips the test if libyaml is not available)
+	"""
+	if not hasattr(yaml, "CSafeLoader"):  # pragma: no cover
+		pytest.skip("PyYAML is built without libyaml")
+
+	c_handler = YamlFileHandler()
+	assert c_handler._get_loader_class() is yaml.CSafeLoader
+
+	return YamlFileHandler(use_libyaml=False), c_handler
+
+
+def _to_plain(obj):
+	"""
+	Turns fixture data (pydantic models, enums, tuples) into plain YAML-serializable data
+	"""
+	if hasattr(obj, "model_dump"):
+		obj = obj.model_dump()
+	if isinstance(obj, dict):
+		return {_to_plain(key): _to_plain(val) for key, val in obj.items()}
+	if isinstance(obj, (list, tuple)):
+		return [_to_plain(val) for val in obj]
+	if isinstance(obj, Enum):
+		return obj.value
+	return obj
@@ -0,0 +1,53 @@
+import os
+import re
+import subprocess
+import sys
+
+import pytest
+
+# NOTE  Generous budget, it guards against heavy eager imports, not against slow machines
+IMPORT_TIME_BUDGET_US = 300_000
+
+LAZY_MODULES = ("yaml", "dotenv", "pydantic", "asyncio", "concurrent.futures", "hashlib")
+
+
+def _run_python(*args: str) -> subprocess.CompletedProcess:
+	env = dict(os.environ)
+	env["PYTHONPATH"] = os.pathsep.join(filter(None, (os.path.abspath("src"), env.get("PYTHONPATH"))))
+	return subprocess.run(
+		[sys.executable, *args],
+		env=env,
+		capture_output=True,
+		text=True,
+		check=True,
+	)
+
+
+class TestImportTime:
+
+	def test_lazy_modules_not_imported(self):
+		code = "\n".join((
+			"import sys",
+			"from simputils.config.components import ConfigHub",
+			"from simputils.config.models import ConfigStore",
+			"conf = ConfigHub.aggregate('tests/data/config-3.json', {'a': 1}, target=ConfigStore())",
+			"assert conf['a'] == 1",
+			f"print(','.join(m for m in {LAZY_MODULES!r} if m in sys.modules))",
+		))
+		res = _run_python("-c", code)
+
+		assert res.stdout.strip() == ""
+
+	@pytest.mark.parametrize("module", ("simputils.config", "simputils.config.components"))
+	def test_import_time(self, module):
+		res = _run_python("-X", "importtime", "-c", f"import {module}")
+
+		cumulative = None
+		for line in res.stderr.splitlines():
+			matched = re.match(r"import time:\s+\d+ \|\s+(\d+) \|\s*(\S+)$", line)
+			if matched and matched.group(2) == module:
+				cumulative = int(matched.group(1))
+				break
+
+		assert cumulative is not None
+		assert cumulative < IMPORT_TIME_BUDGET_US, f"Import of {module} took {cumulative}us"
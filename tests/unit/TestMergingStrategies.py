@@ -1,3 +1,4 @@
+import copy
 import json
 from typing import Annotated
 
@@ -35,6 +36,8 @@ class TestMergingStrategies:
 		fixture_recursive_strategy_list_replace.data,
 	)
 	def test_recursive_strategy_list_replace(self, expected, args):
+		# NOTE  In-place merging modifies nested values of the sources, so fixtures are not used directly
+		args = copy.deepcopy(args)
 		strategy = MergingStrategyRecursive(list_extend=False)
 
 		conf = ConfigHub.aggregate(
@@ -46,11 +49,55 @@ class TestMergingStrategies:
 
 		assert expected == dict(conf)
 
+	@pytest.mark.parametrize(
+		("expected", "args"),
+		fixture_recursive_strategy_list_merge.data,
+	)
+	def test_recursive_strategy_copy_on_write(self, expected, args):
+		args_copy = copy.deepcopy(args)
+		strategy = MergingStrategyRecursive(list_extend=True, copy_on_write=True)
+
+		conf = ConfigHub.aggregate(
+			*args,
+			target=ConfigStore(
+				strategy=strategy
+			)
+		)
+
+		assert expected == dict(conf)
+		assert args_copy == args
+		for record, arg in zip(conf.history[-len(args):], args):
+			assert record.ref is arg
+
+	@pytest.mark.parametrize(
+		("expected", "args"),
+		fixture_recursive_strategy_objects.data,
+	)
+	def test_recursive_strategy_copy_on_write_objects(self, expected, args):
+		ConfigStore._set_pydantic_enabled(True)
+
+		model = args[0][fixture_recursive_strategy_objects.MyConfigEnum.MODEL1]
+		model_dump = model.model_dump()
+		strategy = MergingStrategyRecursive(list_extend=True, copy_on_write=True)
+
+		conf = ConfigHub.aggregate(
+			*args,
+			target=ConfigStore(
+				fixture_recursive_strategy_objects.MyConfigEnum,
+				strategy=strategy,
+			)
+		)
+
+		assert expected == dict(conf)
+		assert model_dump == model.model_dump()
+
 	@pytest.mark.parametrize(
 		("expected", "args"),
 		fixture_recursive_strategy_list_merge.data,
 	)
 	def test_recursive_strategy_list_merge(self, expected, args):
+		# NOTE  In-place merging modifies nested values of the sources, so fixtures are not used directly
+		args = copy.deepcopy(args)
 		strategy = MergingStrategyRecursive(list_extend=True)
 
 		conf = ConfigHub.aggregate(
@@ -68,6 +115,8 @@ class TestMergingStrategies:
 	)
 	def test_recursive_strategy_object_merge(self, expected, args):
 		ConfigStore._set_pydantic_enabled(True)
+		# NOTE  In-place merging modifies nested values of the sources, so fixtures are not used directly
+		args = copy.deepcopy(args)
 
 		strategy = MergingStrategyRecursive(list_extend=True)
 
@@ -124,3 +173,105 @@ class TestMergingStrategies:
 			expected = json.load(fd)
 		assert dict(expected) == dict(json.loads(first_person.json()))
 
+	def test_recursive_strategy_deep_data(self):
+		depth = 5000
+		target = {}
+		incoming = {}
+		last_target, last_incoming = target, incoming
+		for _ in range(depth):
+			last_target["sub"] = {"val": 1, "items": [1]}
+			last_incoming["sub"] = {"other": 2, "items": [2]}
+			last_target, last_incoming = last_target["sub"], last_incoming["sub"]
+
+		strategy = MergingStrategyRecursive(list_extend=True)
+		res = strategy.merge("key", target, incoming)
+
+		assert res is target
+		for _ in range(depth):
+			res = res["sub"]
+			assert res["val"] == 1 and res["other"] == 2 and res["items"] == [1, 2]
+
+	def test_recursive_strategy_self_referencing_data(self):
+		target = {"val": 1}
+		target["self"] = target
+		incoming = {"other": 2}
+		incoming["self"] = incoming
+
+		res = MergingStrategyRecursive().merge("key", target, incoming)
+
+		assert res is target
+		assert res["self"] is target
+		assert res["val"] == 1 and res["other"] == 2
+
+	def test_recursive_strategy_copy_on_write_sharing(self):
+		target = {"changed": {"val": 1}, "unchanged": {"val": 2}, "items": [1]}
+		target["self"] = target
+		incoming = {"changed": {"val": 3}, "items": [2]}
+		incoming["self"] = incoming
+
+		res = MergingStrategyRecursive(list_extend=True, copy_on_write=True).merge("key", target, incoming)
+
+		assert res is not target and res["self"] is res
+		assert res["changed"] == {"val": 3} and target["changed"] == {"val": 1}
+		assert res["unchanged"] is target["unchanged"]
+		assert res["items"] == [1, 2] and target["items"] == [1]
+
+	def test_bulk_apply(self):
+		conf = ConfigStore({"a": 1, "b": 2})
+		conf.config_apply({"b": None, "c": None, "d": 4}, none_considered_empty=True)
+
+		assert dict(conf) == {"a": 1, "b": 2, "c": None, "d": 4}
+		assert conf.history[-1].applied_keys == ["b", "c", "d"]
+
+		conf = ConfigStore({"a": {"x": 1}}, strategy=MergingStrategyRecursive())
+		conf.config_apply({"a": {"y": 2}, "b": None})
+
+		assert dict(conf) == {"a": {"x": 1, "y": 2}, "b": None}
+
+	def test_apply_reads_preprocessed_keys_directly(self):
+		conf = ConfigStore({"a": {"x": 1}}, preprocessor={"a": "b", "b": "c"}, strategy=MergingStrategyRecursive())
+		conf.config_apply({"a": {"y": 2}})
+
+		assert conf.copy() == {"b": {"x": 1, "y": 2}}
+
+	def test_recursive_strategy_list_extend_keeps_sources(self):
+		source1 = {"x": [1], "sub": {"y": (1,)}}
+		source2 = {"x": [2], "sub": {"y": (2,)}}
+
+		conf = ConfigHub.aggregate(
+			source1,
+			source2,
+			target=ConfigStore(strategy=MergingStrategyRecursive(list_extend=True)),
+		)
+
+		assert conf["x"] == [1, 2]
+		assert source1["x"] == [1] and source2["x"] == [2]
+		assert conf.history[0].ref["x"] == [1]
+
+	@pytest.mark.parametrize("copy_on_write", (False, True))
+	def test_recursive_strategy_list_extend_owned_lists(self, copy_on_write):
+		sources = [{"x": [i], "sub": {"y": [i]}} for i in range(5)]
+		# NOTE  Nested dicts of sources are modified in place without copy-on-write, but the lists never are
+		source_lists = [(source["x"], source["sub"]["y"]) for source in sources]
+		strategy = MergingStrategyRecursive(list_extend=True, copy_on_write=copy_on_write)
+
+		conf = ConfigStore(strategy=strategy)
+		conf.config_apply(sources[0])
+		conf.config_apply(sources[1])
+		owned = conf["x"]
+		previous = list(owned)
+		for source in sources[2:]:
+			conf.config_apply(source)
+
+		assert conf["x"] == [0, 1, 2, 3, 4]
+		assert conf["sub"]["y"] == [0, 1, 2, 3, 4]
+		assert source_lists == [([i], [i]) for i in range(5)]
+		if copy_on_write:
+			assert owned == previous
+		else:
+			# NOTE  The list copied by the strategy is extended in place by the following merges
+			assert conf["x"] is owned
+
+		conf.config_apply({"x": "replaced"})
+		assert conf["x"] == "replaced"
+		assert id(owned) not in strategy._owned_lists
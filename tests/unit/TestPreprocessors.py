@@ -1,6 +1,8 @@
 import pytest
 
 from simputils.config.base import simputils_pp_with_cast, simputils_pp, simputils_cast
+from simputils.config.components.preprocessors import SimputilsCastingPreprocessor, \
+	SimputilsStandardPreprocessor, PreprocessorPipeline
 from simputils.config.models import ConfigStore
 
 _params_fixture_names = "key_orig,key_exp,val_orig,val_exp,val_type"
@@ -33,6 +35,12 @@ _params_fixture_values = [
 	("K", "K", "0.0", 0.0, float),
 	("K", "K", "-3.1415", -3.1415, float),
 	("K", "K", "+3.1415", 3.1415, float),
+	("K", "K", "5.", 5.0, float),
+	("K", "K", ".5", 0.5, float),
+	("K", "K", ".", ".", str),
+	("K", "K", "+.", "+.", str),
+	("K", "K", "1..2", "1..2", str),
+	("K", "K", "1.2.3", "1.2.3", str),
 
 	("K", "K", "t", True, bool),
 	("K", "K", "T", True, bool),
@@ -90,3 +98,80 @@ class TestPreprocessors:
 		assert isinstance(conf["MY_KEY_2"], float)
 		assert "MY_KEY_3" in conf
 		assert conf["MY_KEY_3"] is None
+
+	def test_casting_preprocessor_cast_many(self):
+		caster = SimputilsCastingPreprocessor.instance()
+		assert caster is SimputilsCastingPreprocessor.instance()
+
+		res = caster.cast_many({"a": "On", "b": "-12", "c": "1.5", "d": "NIL", "e": 12, "f": "text"})
+		assert res == {"a": True, "b": -12, "c": 1.5, "d": None, "e": 12, "f": "text"}
+
+	def test_casting_preprocessor_redefined_lists(self):
+		class MyCastingPreprocessor(SimputilsCastingPreprocessor):
+			list_yes = ["da"]
+
+		caster = MyCastingPreprocessor.instance()
+		assert caster is not SimputilsCastingPreprocessor.instance()
+		assert caster.cast("DA") is True
+		assert caster.cast("yes") == "yes"
+
+		MyCastingPreprocessor.list_yes = ["si"]
+		assert caster.cast("si") is True
+		assert caster.cast("da") == "da"
+
+		MyCastingPreprocessor.list_yes.append("ja")
+		assert caster.cast("ja") == "ja"
+		caster.rebuild()
+		assert caster.cast("ja") is True
+		MyCastingPreprocessor.list_yes.remove("si")
+		caster.rebuild()
+		assert caster.cast("si") == "si"
+		assert caster.cast_many({"a": "JA", "b": "si", "c": "no"}) == {"a": True, "b": "si", "c": False}
+
+	def test_standard_preprocessor_reusable(self):
+		pp = SimputilsStandardPreprocessor(replace_pattern=r"[^0-9a-zA-Z]+", cache_size=2)
+
+		conf = ConfigStore({"my key #1": 1, "my__key 2": 2, "my key 3": 3}, preprocessor=pp)
+		assert dict(conf) == {"MY_KEY_1": 1, "MY_KEY_2": 2, "MY_KEY_3": 3}
+		assert conf["my key 3"] == 3
+		assert len(pp._keys) == 2
+
+		assert pp("a-b", "val") == ("A_B", "val")
+		assert pp("a-b", "val", r"-", "") == ("AB", "val")
+
+		assert SimputilsStandardPreprocessor.instance() is SimputilsStandardPreprocessor.instance()
+		assert simputils_pp("my key", 1) == ("MY_KEY", 1)
+		assert simputils_pp("my key", 1, replaced_with="-") == ("MY-KEY", 1)
+
+	def test_preprocessor_pipeline(self):
+		def upper_values(k, v):
+			return k, v.upper()
+
+		pipeline = PreprocessorPipeline(
+			[
+				{"a": "b", "c": "d"},
+				[{"b": "e"}, simputils_pp],
+				upper_values,
+				{"E": "F"},
+			],
+			timing=True,
+		)
+
+		assert [stage["stage"] for stage in pipeline.info()] == [
+			"keys(rename, SimputilsStandardPreprocessor)",
+			"upper_values",
+			"keys(rename)",
+		]
+		assert pipeline.stages[0].parts[0] == {"a": "e", "c": "d", "b": "e"}
+
+		assert pipeline("a", "val") == ("F", "VAL")
+		assert pipeline("my key", "val") == ("MY_KEY", "VAL")
+		assert pipeline("b", "val") == ("F", "VAL")
+		assert [stage["calls"] for stage in pipeline.info()] == [3, 3, 3]
+
+		pipeline.reset_timings()
+		assert [stage["calls"] for stage in pipeline.info()] == [0, 0, 0]
+
+		conf = ConfigStore({"a": "val", "my key": "val 2"}, preprocessor=[{"a": "b"}, {"b": "c"}, simputils_pp_with_cast])
+		assert dict(conf) == {"C": "val", "MY_KEY": "val 2"}
+		assert conf["a"] == "val"